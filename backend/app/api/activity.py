@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database import get_read_db
+from app.services.activity import list_activity
+from app.services.profiling import ProfiledRoute
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.get("/boards/{board_id}/activity")
+def get_board_activity(
+    board_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """Get the activity stream of a board, newest first.
+
+    Pass ``next_cursor`` from the response as ``cursor`` to get the next page.
+    Events stay readable after the board was deleted.
+    """
+    try:
+        events, next_cursor = list_activity(db, board_id, limit, cursor, entity_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return ORJSONResponse({"events": events, "next_cursor": next_cursor})
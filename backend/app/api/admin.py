@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, ORJSONResponse, PlainTextResponse
+from typing import Optional
+from app.services.profiling import (
+    cache_report, is_admin, list_profiles, memory_profiler, profile_path, profile_summary
+)
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Dependency that checks the X-Admin-Token header against PROFILING_TOKEN."""
+    if not is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles")
+def get_profiles():
+    """Get the request profiles written by this server, newest first."""
+    return ORJSONResponse(list_profiles())
+
+
+@router.get("/profiles/{name}")
+def get_profile(name: str, format: Optional[str] = Query(None, pattern="^text$")):
+    """Download a request profile.
+
+    cProfile dumps (``.prof``) open with pstats or snakeviz; pass
+    ``format=text`` for the top functions by cumulative time instead.
+    """
+    path = profile_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "text":
+        if not name.endswith(".prof"):
+            raise HTTPException(status_code=400, detail="Text summaries are only available for cProfile dumps")
+        return PlainTextResponse(profile_summary(path))
+    return FileResponse(path, filename=name)
+
+
+@router.get("/memory")
+def get_memory_snapshot(
+    limit: int = Query(25, ge=1, le=200),
+    group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$")
+):
+    """Take a tracemalloc snapshot of this worker process.
+
+    The first call starts tracing; later calls list the top allocation sites
+    and the growth since the previous call. Tracing slows the process down,
+    so stop it when done.
+    """
+    return ORJSONResponse(memory_profiler.snapshot(limit, group_by))
+
+
+@router.delete("/memory/tracing", status_code=204)
+def stop_memory_tracing():
+    """Stop tracemalloc tracing."""
+    memory_profiler.stop()
+    return None
+
+
+@router.get("/caches")
+def get_cache_sizes():
+    """Get the approximate size of the in-memory caches of this worker process, per board."""
+    return ORJSONResponse(cache_report())
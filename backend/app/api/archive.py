@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database import get_db, get_read_db
+from app.models import Board
+from app.schemas import Card as CardSchema, CardRestore
+from app.services.archive import archive_card, archive_done_cards, restore_card, search_archive
+from app.services.profiling import ProfiledRoute
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.post("/cards/{card_id}/archive")
+def archive(card_id: str, db: Session = Depends(get_db)):
+    """Move a card from its board into the archive"""
+    archived = archive_card(db, card_id)
+    if archived is None:
+        raise HTTPException(status_code=404, detail="Card not found")
+    return ORJSONResponse(archived)
+
+@router.post("/boards/{board_id}/archive/done")
+def archive_done(board_id: str, older_than_days: int = Query(30, ge=0), db: Session = Depends(get_db)):
+    """Archive all cards of a board that sat untouched in a "Done" list for ``older_than_days``"""
+    if not db.query(Board.id).filter(Board.id == board_id).first():
+        raise HTTPException(status_code=404, detail="Board not found")
+    return {"archived": archive_done_cards(db, older_than_days, board_id)}
+
+@router.get("/boards/{board_id}/archive")
+def get_archive(
+    board_id: str,
+    q: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """Search the archived cards of a board, most recently archived first.
+
+    Pass ``next_cursor`` from the response as ``cursor`` to get the next page.
+    """
+    try:
+        cards, next_cursor = search_archive(db, board_id, q, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return ORJSONResponse({"cards": cards, "next_cursor": next_cursor})
+
+@router.post("/archive/{card_id}/restore", response_model=CardSchema)
+def restore(card_id: str, body: Optional[CardRestore] = None, db: Session = Depends(get_db)):
+    """Move an archived card back to its board (to its original list unless list_id is given)"""
+    try:
+        card = restore_card(db, card_id, body.list_id if body else None)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="List not found")
+    if card is None:
+        raise HTTPException(status_code=404, detail="Archived card not found")
+    return card
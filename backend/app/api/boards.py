@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+import zlib
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List as ListType
-from app.database import get_db
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm.exc import StaleDataError
+from typing import List as ListType, Optional, Sequence
+from app.database import get_db, get_read_db
 from app.models import Board, List, Card
 from app.schemas import (
     Board as BoardSchema,
@@ -14,30 +19,137 @@ from app.schemas import (
     CardCreate,
     CardUpdate,
 )
+from app.services.activity import activity_log
+from app.services.board_payload import CARD_FIELDS, DEFAULT_CARD_FIELDS, board_payloads
+from app.services.change_log import all_boards_version, board_version, changes_since, record_change
+from app.services.profiling import ProfiledRoute
+from app.services.reminders import is_new_due_date, reminder_scheduler
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
+
+# Clients may keep responses but must revalidate them with If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+
+def _card_fields(fields: Optional[str]) -> Sequence[str]:
+    """Parse the comma-separated ``fields`` query parameter."""
+    if fields is None:
+        return DEFAULT_CARD_FIELDS
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = set(names) - set(CARD_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown card fields: {', '.join(sorted(unknown))}")
+    return names
+
+
+def _cacheable(etag: str, if_none_match: Optional[str], payload) -> Response:
+    """Return the payload with caching headers, or 304 if the client's copy is current.
+
+    ``payload`` is called only when the response is not a 304.
+    """
+    # The compression middleware adds "Vary: Accept-Encoding" to compressed responses
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if if_none_match is not None and (
+        if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload(), headers=headers)
+
+
+def _check_if_match(if_match: Optional[str], current_version: int, current_state: dict) -> None:
+    """Reject the update with 409 if the If-Match version is not the current one."""
+    if if_match is None or if_match.strip() == "*":
+        # "*" matches any existing version
+        return
+    try:
+        expected_version = int(if_match.removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must be a version number")
+    if expected_version != current_version:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Version conflict", "current": current_state}
+        )
+
+
+def _commit_versioned(db: Session, obj, schema) -> None:
+    """Commit an update or delete, turning a concurrent write into a 409 with the current state."""
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        try:
+            db.refresh(obj)
+        except InvalidRequestError:
+            # Deleted concurrently
+            raise HTTPException(status_code=404, detail=f"{type(obj).__name__} not found")
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Version conflict", "current": schema.model_validate(obj).model_dump(mode="json")}
+        )
 
 # Board endpoints
+def _board_etag(db: Session, board_id: Optional[str], card_fields: Sequence[str]) -> str:
+    version = all_boards_version(db) if board_id is None else board_version(db, board_id)
+    return f'W/"{version}-{zlib.crc32(",".join(card_fields).encode()):x}"'
+
 @router.get("/boards", response_model=ListType[BoardSchema])
-def get_boards(db: Session = Depends(get_db)):
-    """Get all boards"""
-    boards = db.query(Board).all()
-    return boards
+def get_boards(
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db)
+):
+    """Get all boards (``fields`` selects card fields, see GET /boards/{board_id})"""
+    card_fields = _card_fields(fields)
+    # Pre-built dicts skip response_model validation of every ORM card
+    return _cacheable(_board_etag(db, None, card_fields), if_none_match, lambda: board_payloads(db, None, card_fields))
 
 @router.get("/boards/{board_id}", response_model=BoardSchema)
-def get_board(board_id: str, db: Session = Depends(get_db)):
-    """Get a specific board with all lists and cards"""
-    board = db.query(Board).filter(Board.id == board_id).first()
-    if not board:
+def get_board(
+    board_id: str,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db)
+):
+    """Get a specific board with all lists and cards.
+
+    ``fields`` is a comma-separated list of card fields to include, e.g.
+    ``title,description_preview,labels,due_date`` for a board view that loads
+    full descriptions per card via GET /cards/{card_id}. Card id, list_id,
+    order and version are always included.
+    """
+    card_fields = _card_fields(fields)
+    # Before the ETag check, so an unknown board is a 404 and never a 304
+    if db.query(Board.id).filter(Board.id == board_id).first() is None:
         raise HTTPException(status_code=404, detail="Board not found")
-    return board
+    etag = _board_etag(db, board_id, card_fields)
+
+    def payload():
+        boards = board_payloads(db, board_id, card_fields)
+        if not boards:
+            # Deleted since the check above
+            raise HTTPException(status_code=404, detail="Board not found")
+        return boards[0]
+
+    return _cacheable(etag, if_none_match, payload)
+
+@router.get("/boards/{board_id}/changes")
+def get_board_changes(board_id: str, since: Optional[int] = None, db: Session = Depends(get_read_db)):
+    """Get compacted changes since a sync version, or a snapshot if too old"""
+    result = changes_since(db, board_id, since)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    return ORJSONResponse(result)
 
 @router.post("/boards", response_model=BoardSchema, status_code=201)
 def create_board(board: BoardCreate, db: Session = Depends(get_db)):
     """Create a new board"""
     db_board = Board(title=board.title)
     db.add(db_board)
+    db.flush()
+    record_change(db, db_board.id, "board", db_board.id)
     db.commit()
+    activity_log.emit(db_board.id, "user", "board.created", db_board.id, title=db_board.title)
     db.refresh(db_board)
     return db_board
 
@@ -51,7 +163,9 @@ def update_board(board_id: str, board: BoardUpdate, db: Session = Depends(get_db
     if board.title is not None:
         db_board.title = board.title
 
+    record_change(db, db_board.id, "board", db_board.id)
     db.commit()
+    activity_log.emit(db_board.id, "user", "board.updated", db_board.id, title=db_board.title)
     db.refresh(db_board)
     return db_board
 
@@ -63,7 +177,9 @@ def delete_board(board_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Board not found")
 
     db.delete(db_board)
+    record_change(db, db_board.id, "board", db_board.id, "delete")
     db.commit()
+    activity_log.emit(board_id, "user", "board.deleted", board_id)
     return None
 
 # List endpoints
@@ -81,24 +197,40 @@ def create_list(list_data: ListCreate, db: Session = Depends(get_db)):
         order=list_data.order
     )
     db.add(db_list)
+    db.flush()
+    record_change(db, db_list.board_id, "list", db_list.id)
     db.commit()
+    activity_log.emit(db_list.board_id, "user", "list.created", db_list.id, title=db_list.title)
     db.refresh(db_list)
     return db_list
 
 @router.put("/lists/{list_id}", response_model=ListResponse)
-def update_list(list_id: str, list_data: ListUpdate, db: Session = Depends(get_db)):
-    """Update a list"""
+def update_list(
+    list_id: str,
+    list_data: ListUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """Update a list (pass its version as If-Match to reject concurrent edits)"""
     db_list = db.query(List).filter(List.id == list_id).first()
     if not db_list:
         raise HTTPException(status_code=404, detail="List not found")
+    _check_if_match(if_match, db_list.version, ListResponse.model_validate(db_list).model_dump(mode="json"))
 
     if list_data.title is not None:
         db_list.title = list_data.title
     if list_data.order is not None:
         db_list.order = list_data.order
 
-    db.commit()
+    record_change(db, db_list.board_id, "list", db_list.id)
+    _commit_versioned(db, db_list, ListResponse)
+    activity_log.emit(
+        db_list.board_id, "user", "list.updated", db_list.id,
+        fields=sorted(list_data.model_dump(exclude_none=True))
+    )
     db.refresh(db_list)
+    response.headers["ETag"] = f'"{db_list.version}"'
     return db_list
 
 @router.delete("/lists/{list_id}", status_code=204)
@@ -108,11 +240,26 @@ def delete_list(list_id: str, db: Session = Depends(get_db)):
     if not db_list:
         raise HTTPException(status_code=404, detail="List not found")
 
+    for db_card in db_list.cards:
+        record_change(db, db_list.board_id, "card", db_card.id, "delete")
+    record_change(db, db_list.board_id, "list", db_list.id, "delete")
+    board_id, title, card_count = db_list.board_id, db_list.title, len(db_list.cards)
     db.delete(db_list)
-    db.commit()
+    _commit_versioned(db, db_list, ListResponse)
+    activity_log.emit(board_id, "user", "list.deleted", list_id, title=title, card_count=card_count)
     return None
 
 # Card endpoints
+@router.get("/cards/{card_id}", response_model=CardSchema)
+def get_card(card_id: str, if_none_match: Optional[str] = Header(None), db: Session = Depends(get_read_db)):
+    """Get a single card with all details"""
+    db_card = db.query(Card).filter(Card.id == card_id).first()
+    if not db_card:
+        raise HTTPException(status_code=404, detail="Card not found")
+    return _cacheable(
+        f'"{db_card.version}"', if_none_match, lambda: CardSchema.model_validate(db_card).model_dump(mode="json")
+    )
+
 @router.post("/cards", response_model=CardSchema, status_code=201)
 def create_card(card: CardCreate, db: Session = Depends(get_db)):
     """Create a new card"""
@@ -130,16 +277,30 @@ def create_card(card: CardCreate, db: Session = Depends(get_db)):
         due_date=card.due_date,
     )
     db.add(db_card)
+    db.flush()
+    record_change(db, list_obj.board_id, "card", db_card.id)
     db.commit()
+    activity_log.emit(list_obj.board_id, "user", "card.created", db_card.id, list_id=db_card.list_id, title=db_card.title)
     db.refresh(db_card)
+    if db_card.due_date is not None:
+        reminder_scheduler.schedule(db_card.id, db_card.due_date)
     return db_card
 
 @router.put("/cards/{card_id}", response_model=CardSchema)
-def update_card(card_id: str, card: CardUpdate, db: Session = Depends(get_db)):
-    """Update a card"""
+def update_card(
+    card_id: str,
+    card: CardUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """Update a card (pass its version as If-Match to reject concurrent edits)"""
     db_card = db.query(Card).filter(Card.id == card_id).first()
     if not db_card:
         raise HTTPException(status_code=404, detail="Card not found")
+    _check_if_match(if_match, db_card.version, CardSchema.model_validate(db_card).model_dump(mode="json"))
+    from_list_id, from_board_id = db_card.list_id, db_card.list.board_id
+    due_date_moved = card.due_date is not None and is_new_due_date(db_card.due_date, card.due_date)
 
     if card.title is not None:
         db_card.title = card.title
@@ -147,19 +308,36 @@ def update_card(card_id: str, card: CardUpdate, db: Session = Depends(get_db)):
         db_card.description = card.description
     if card.labels is not None:
         db_card.labels = card.labels
-    if card.due_date is not None:
+    if due_date_moved:
         db_card.due_date = card.due_date
+        db_card.reminder_sent_at = None
     if card.list_id is not None:
         # Verify new list exists
         list_obj = db.query(List).filter(List.id == card.list_id).first()
         if not list_obj:
             raise HTTPException(status_code=404, detail="List not found")
+        if list_obj.board_id != db_card.list.board_id:
+            record_change(db, db_card.list.board_id, "card", db_card.id, "delete")
+        if db_card.list_id != card.list_id:
+            db_card.list_entered_at = datetime.utcnow()
         db_card.list_id = card.list_id
     if card.order is not None:
         db_card.order = card.order
 
-    db.commit()
+    board_id = db.query(List.board_id).filter(List.id == db_card.list_id).scalar()
+    record_change(db, board_id, "card", db_card.id)
+    _commit_versioned(db, db_card, CardSchema)
+    if db_card.list_id != from_list_id:
+        activity_log.emit(
+            board_id, "user", "card.moved", db_card.id, from_board_id=from_board_id,
+            from_list_id=from_list_id, to_list_id=db_card.list_id, title=db_card.title
+        )
+    else:
+        activity_log.emit(board_id, "user", "card.updated", db_card.id, fields=sorted(card.model_dump(exclude_none=True)))
     db.refresh(db_card)
+    if due_date_moved:
+        reminder_scheduler.schedule(db_card.id, db_card.due_date)
+    response.headers["ETag"] = f'"{db_card.version}"'
     return db_card
 
 @router.delete("/cards/{card_id}", status_code=204)
@@ -169,6 +347,10 @@ def delete_card(card_id: str, db: Session = Depends(get_db)):
     if not db_card:
         raise HTTPException(status_code=404, detail="Card not found")
 
+    board_id, list_id, title = db_card.list.board_id, db_card.list_id, db_card.title
+    record_change(db, board_id, "card", db_card.id, "delete")
     db.delete(db_card)
-    db.commit()
+    _commit_versioned(db, db_card, CardSchema)
+    activity_log.emit(board_id, "user", "card.deleted", card_id, list_id=list_id, title=title)
+    reminder_scheduler.cancel(card_id)
     return None
@@ -1,13 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-from app.database import get_db
-from app.services.chat import chat_service
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from app.database import get_db, get_read_db
 from app.models import Board
+from app.services.chat_history import clear_chat_history, get_chat_history
+from app.services.profiling import ProfiledRoute
 
+if TYPE_CHECKING:
+    from app.services.chat import ChatService
 
-router = APIRouter()
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+def get_chat_service() -> "ChatService":
+    """Dependency for the chat service.
+
+    Imported lazily so LangChain and the LLM client are only loaded once the
+    first chat request arrives, not when the app starts.
+    """
+    from app.services.chat import get_chat_service
+    return get_chat_service()
 
 
 class ChatMessageRequest(BaseModel):
@@ -36,7 +50,8 @@ class ChatHistoryItem(BaseModel):
 @router.post("/chat/message", response_model=ChatMessageResponse)
 def send_chat_message(
     request: ChatMessageRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    chat_service: "ChatService" = Depends(get_chat_service)
 ):
     """Send a message to the AI assistant for a specific board."""
     # Verify board exists
@@ -49,24 +64,24 @@ def send_chat_message(
 
 
 @router.get("/chat/history/{board_id}", response_model=List[ChatHistoryItem])
-def get_chat_history(board_id: str, db: Session = Depends(get_db)):
+def get_board_chat_history(board_id: str, db: Session = Depends(get_read_db)):
     """Get chat history for a board."""
     # Verify board exists
     board = db.query(Board).filter(Board.id == board_id).first()
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
 
-    history = chat_service.get_history(board_id)
+    history = get_chat_history(db, board_id)
     return [ChatHistoryItem(**item) for item in history]
 
 
 @router.delete("/chat/history/{board_id}", status_code=204)
-def clear_chat_history(board_id: str, db: Session = Depends(get_db)):
+def clear_board_chat_history(board_id: str, db: Session = Depends(get_db)):
     """Clear chat history for a board."""
     # Verify board exists
     board = db.query(Board).filter(Board.id == board_id).first()
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
 
-    chat_service.clear_history(board_id)
+    clear_chat_history(db, board_id)
     return None
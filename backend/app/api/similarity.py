@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database import get_read_db
+from app.services.profiling import ProfiledRoute
+from app.services.similarity import similarity_index
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.get("/cards/similar")
+def get_similar_cards(
+    board_id: Optional[str] = None,
+    q: Optional[str] = None,
+    card_id: Optional[str] = None,
+    limit: int = Query(5, ge=1, le=50),
+    min_score: float = Query(0.3, ge=0, le=1),
+    db: Session = Depends(get_read_db)
+):
+    """Find cards similar to a text (``board_id`` and ``q``) or to an existing card (``card_id``).
+
+    Useful to spot duplicates before creating a card. Each result has a
+    cosine similarity ``score`` between 0 and 1.
+    """
+    if card_id is not None:
+        cards = similarity_index.similar_to_card(db, card_id, limit, min_score)
+        if cards is None:
+            raise HTTPException(status_code=404, detail="Card not found")
+    elif board_id is not None and q:
+        cards = similarity_index.search(db, board_id, q, limit, min_score)
+        if cards is None:
+            raise HTTPException(status_code=404, detail="Board not found")
+    else:
+        raise HTTPException(status_code=400, detail="Pass card_id, or board_id and q")
+    return ORJSONResponse({"cards": cards})
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.models import Board
+from app.services.activity import activity_log
+from app.services.profiling import ProfiledRoute
+from app.services.stats import board_stats, has_board_stats, recompute_board_stats
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.get("/boards/{board_id}/stats")
+def get_board_stats(board_id: str, days: int = Query(30, ge=1, le=365), db: Session = Depends(get_db)):
+    """Get WIP per list, cumulative flow and cycle time for a board"""
+    board = db.query(Board.id).filter(Board.id == board_id).first()
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    if not has_board_stats(db, board_id):
+        # First request for a board that predates the counters. The flush uses
+        # its own session, so end ours first to free the writer connection.
+        db.commit()
+        activity_log.flush()
+        recompute_board_stats(db, board_id)
+    return ORJSONResponse(board_stats(db, board_id, days))
+
+
+@router.post("/boards/{board_id}/stats/recompute", status_code=204)
+def recompute_stats(board_id: str, db: Session = Depends(get_db)):
+    """Rebuild the board's statistics from the raw activity events"""
+    board = db.query(Board.id).filter(Board.id == board_id).first()
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    db.commit()
+    activity_log.flush()
+    recompute_board_stats(db, board_id)
+    return None
@@ -1,10 +1,96 @@
 from pydantic_settings import BaseSettings
 from typing import List
+import os
 
 class Settings(BaseSettings):
     DATABASE_URL: str
     CORS_ORIGINS: str = "http://localhost:5174"
-    GEMINI_API_KEY: str
+    GEMINI_API_KEY: str = ""
+    DB_CREATE_TABLES: bool = True  # Disable when the schema is managed by migrations
+    DATABASE_REPLICA_URL: str = ""  # Read-only routes use this replica when set
+    READ_YOUR_WRITES_SECONDS: int = 5  # Reads stay on the primary this long after a write; keep above replica lag
+
+    # Embedded SQLite profile for single-node deployments (ignored for other databases)
+    SQLITE_TUNED: bool = True  # WAL and pragmas, one writer connection and a reader pool per process
+    SQLITE_READ_POOL_SIZE: int = 4
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait for other processes' writes instead of "database is locked"
+    SQLITE_MMAP_SIZE: int = 268435456  # Bytes of the database file memory-mapped for reads
+    SQLITE_WRITE_QUEUE_TIMEOUT: float = 30.0  # Max seconds a write waits for the writer connection
+
+    # Response compression
+    COMPRESSION: str = "gzip"  # "gzip", "br" (needs brotli-asgi, gzip for other clients) or "off"
+    COMPRESSION_MIN_SIZE: int = 1024  # Bytes; smaller responses are sent uncompressed
+    COMPRESSION_LEVEL: int = 5  # gzip 1-9, brotli 0-11
+
+    # Change log, activity stream and board statistics
+    CHANGE_LOG_RETENTION_DAYS: int = 7  # Older sync changes are pruned; clients then get a snapshot
+    ACTIVITY_FLUSH_INTERVAL: float = 1.0  # Seconds between batched activity writes
+    ACTIVITY_BUFFER_SIZE: int = 10000  # Max buffered events per process; oldest are dropped beyond
+    ACTIVITY_RETENTION_DAYS: int = 90
+    STATS_DONE_LISTS: str = "Done,Fertig,Erledigt"  # List titles that count as finished for cycle time and archiving
+
+    # Card archive
+    ARCHIVE_DONE_AFTER_DAYS: int = 30  # Archive cards that have been in a "Done" list this long; 0 disables
+    ARCHIVE_INTERVAL_SECONDS: int = 3600
+
+    # Similar-card lookup (GET /cards/similar, agent tool find_similar_cards)
+    SIMILARITY_MAX_BOARDS: int = 200  # Boards whose card vectors are kept in memory per process
+
+    # Due-date reminders
+    REMINDERS_ENABLED: bool = True
+    REMINDER_SINK: str = "log"  # "log" or "webhook"
+    REMINDER_WEBHOOK_URL: str = ""
+    REMINDER_LEAD_MINUTES: int = 60  # Notify this long before the due date
+    REMINDER_HORIZON_HOURS: int = 24  # Deadlines kept in memory; reloaded every REMINDER_REFRESH_SECONDS
+    REMINDER_CATCH_UP_HOURS: int = 24  # Still send reminders missed by up to this long, e.g. after downtime
+    REMINDER_MAX_PENDING: int = 10000
+    REMINDER_TICK_SECONDS: float = 5.0
+    REMINDER_REFRESH_SECONDS: int = 600
+
+    # LLM backend: "gemini" talks to Google, "replay" plays back a recorded conversation
+    LLM_PROVIDER: str = "gemini"
+    LLM_MODEL: str = "gemini-2.5-flash"
+    LLM_TEMPERATURE: float = 0.7
+    LLM_RECORD_DIR: str = ""  # Record every chat turn to <dir>/<board_id>.json when set
+    LLM_REPLAY_FILE: str = ""  # Recording used by the "replay" provider
+    LLM_VERBOSE: bool = True  # Log every agent step to stdout
+
+    # Profiling (opt-in): X-Profile request header and /api/admin endpoints
+    PROFILING_ENABLED: bool = False
+    PROFILING_TOKEN: str = ""  # Required with PROFILING_ENABLED; sent as X-Admin-Token header
+    PROFILER: str = "cprofile"  # "cprofile" or "pyinstrument" (needs pyinstrument)
+    PROFILING_DIR: str = "profiles"
+    TRACEMALLOC_FRAMES: int = 10  # Stack depth recorded per allocation once memory tracing is on
+
+    # Production server (serve.py / gunicorn.conf.py)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8080
+    WORKERS: int = 0  # 0 = one worker per CPU core
+    KEEP_ALIVE_TIMEOUT: int = 5
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
+    DB_MAX_CONNECTIONS: int = 40  # Connection budget shared by all workers, per database endpoint
+    DB_MAX_OVERFLOW: int = 2  # Extra connections per worker during bursts
+
+    @property
+    def worker_count(self) -> int:
+        return self.WORKERS or os.cpu_count() or 1
+
+    @property
+    def db_pool_size(self) -> int:
+        """Per-worker pool size so that all workers stay within DB_MAX_CONNECTIONS."""
+        return max(1, self.DB_MAX_CONNECTIONS // self.worker_count - self.DB_MAX_OVERFLOW)
+
+    @property
+    def sqlite_tuned(self) -> bool:
+        # In-memory databases are private to each connection, so they cannot use separate engines
+        return (
+            self.SQLITE_TUNED and self.DATABASE_URL.startswith("sqlite")
+            and ":memory:" not in self.DATABASE_URL and self.DATABASE_URL.rstrip("/") != "sqlite:"
+        )
+
+    @property
+    def done_list_titles(self) -> List[str]:
+        return [title.strip().lower() for title in self.STATS_DONE_LISTS.split(",")]
 
     @property
     def cors_origins_list(self) -> List[str]:
@@ -1,3 +1,4 @@
-from app.database.session import Base, get_db, engine
+from app.database.session import Base, get_db, get_read_db, engine
+from app.database.schema import create_tables
 
-__all__ = ["Base", "get_db", "engine"]
+__all__ = ["Base", "get_db", "get_read_db", "engine", "create_tables"]
@@ -0,0 +1,55 @@
+import logging
+from sqlalchemy import inspect, literal
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import Column
+from app.database.session import Base
+
+logger = logging.getLogger(__name__)
+
+
+def _column_ddl(column: Column, conn: Connection) -> str:
+    """Column definition for ALTER TABLE ... ADD COLUMN.
+
+    Existing rows get the column's scalar default; NOT NULL is only kept
+    when there is one, since the rows would otherwise violate it.
+    """
+    ddl = f"{conn.dialect.identifier_preparer.quote(column.name)} {column.type.compile(dialect=conn.dialect)}"
+    default = column.default.arg if column.default is not None and column.default.is_scalar else None
+    if default is not None:
+        value = literal(default, column.type).compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+        ddl += f" DEFAULT {value}"
+        if not column.nullable:
+            ddl += " NOT NULL"
+    return ddl
+
+
+def create_tables(engine: Engine) -> None:
+    """Create missing tables and upgrade existing ones to the current models.
+
+    ``create_all`` only creates whole tables, so columns and indexes added
+    to a table in a later version (e.g. ``boards.changes_pruned_through``,
+    ``cards.version``, ``cards.reminder_sent_at``) are added here. Columns
+    are never changed or dropped; use migrations for anything beyond that.
+    """
+    import app.models  # noqa: F401  (register all tables)
+
+    # One connection throughout: the tuned SQLite writer pool has only one
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in columns:
+                    logger.info("Adding column %s.%s", table.name, column.name)
+                    conn.exec_driver_sql(f"ALTER TABLE {conn.dialect.identifier_preparer.format_table(table)} ADD COLUMN {_column_ddl(column, conn)}")
+                    backfill_from = column.info.get("backfill_from")
+                    if backfill_from:
+                        # Best available value for existing rows
+                        conn.execute(table.update().values({column: table.c[backfill_from]}))
+
+            indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    logger.info("Adding index %s", index.name)
+                    index.create(conn)
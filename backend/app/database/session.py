@@ -1,14 +1,80 @@
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
-# Add check_same_thread=False for SQLite
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+# Set after a write; while present, the client's reads go to the primary
+READ_PRIMARY_COOKIE = "db_read_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _create_engine(url: str):
+    if "sqlite" in url:
+        # Add check_same_thread=False for SQLite
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False}
+        )
+    # Each worker process gets its share of the connection budget
+    return create_engine(
+        url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True
+    )
+
+
+def _create_sqlite_engine(url: str, writer: bool):
+    """Engine for the tuned SQLite profile.
+
+    The writer engine has a single connection, so a process queues its writes
+    in the pool instead of failing with "database is locked"; transactions
+    start with BEGIN IMMEDIATE so they never have to upgrade a stale read
+    lock. Readers get a pool of read-only connections that WAL lets run
+    alongside the writer.
+    """
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=1 if writer else settings.SQLITE_READ_POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=settings.SQLITE_WRITE_QUEUE_TIMEOUT,
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself instead of the driver's implicit one
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+        if not writer:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if writer else "BEGIN")
+
+    return engine
+
+
+if settings.sqlite_tuned:
+    engine = _create_sqlite_engine(settings.DATABASE_URL, writer=True)
+    sqlite_reader_engine = _create_sqlite_engine(settings.DATABASE_URL, writer=False)
+else:
+    engine = _create_engine(settings.DATABASE_URL)
+    sqlite_reader_engine = engine
+# Read-only routes use the replica when one is configured, with a pool of its own
+replica_engine = (
+    _create_engine(settings.DATABASE_REPLICA_URL) if settings.DATABASE_REPLICA_URL else sqlite_reader_engine
 )
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
 
 Base = declarative_base()
 
@@ -18,3 +84,24 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_read_db(request: Request):
+    """Session for read-only routes: the replica, unless the client wrote recently."""
+    db = SessionLocal() if READ_PRIMARY_COOKIE in request.cookies else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def read_your_writes(request: Request, call_next):
+    """Pin the client's reads to the primary for a while after a successful write.
+
+    The pin is a short-lived cookie rather than process state, so it holds
+    no matter which worker serves the next read.
+    """
+    response = await call_next(request)
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        response.set_cookie(
+            READ_PRIMARY_COOKIE, "1", max_age=settings.READ_YOUR_WRITES_SECONDS, httponly=True, samesite="lax"
+        )
+    return response
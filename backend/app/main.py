@@ -1,14 +1,90 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
-from app.database import engine, Base
-from app.api import boards, chat
+from app.database import engine, create_tables
+from app.database.session import SessionLocal, read_your_writes
+from app.api import activity, admin, archive, boards, chat, similarity, stats
+from app.services.activity import activity_log, prune_activity
+from app.services.archive import archive_done_cards
+from app.services.change_log import prune_change_log
+from app.services.profiling import profile_requests
+from app.services.reminders import reminder_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+def _with_session(func):
+    def run():
+        db = SessionLocal()
+        try:
+            func(db)
+        finally:
+            db.close()
+    return run
+
+
+def _prune_logs(db):
+    prune_change_log(db, settings.CHANGE_LOG_RETENTION_DAYS)
+    prune_activity(db, settings.ACTIVITY_RETENTION_DAYS)
+
+
+def _archive_done_cards(db):
+    archive_done_cards(db, settings.ARCHIVE_DONE_AFTER_DAYS)
+
+
+async def _run_periodically(func, interval: float, description: str):
+    while True:
+        try:
+            await run_in_threadpool(func)
+        except Exception:
+            logger.exception("%s failed", description)
+        await asyncio.sleep(interval)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create or upgrade database tables once per process start instead of at import time
+    if settings.DB_CREATE_TABLES:
+        create_tables(engine)
+    tasks = [
+        asyncio.create_task(_run_periodically(_with_session(_prune_logs), 3600, "Pruning change log and activity")),
+        asyncio.create_task(_run_periodically(
+            activity_log.flush, settings.ACTIVITY_FLUSH_INTERVAL, "Writing activity events"
+        )),
+    ]
+    if settings.ARCHIVE_DONE_AFTER_DAYS > 0:
+        tasks.append(asyncio.create_task(_run_periodically(
+            _with_session(_archive_done_cards), settings.ARCHIVE_INTERVAL_SECONDS, "Archiving done cards"
+        )))
+    if settings.REMINDERS_ENABLED:
+        tasks += [
+            asyncio.create_task(_run_periodically(
+                _with_session(reminder_scheduler.refresh), settings.REMINDER_REFRESH_SECONDS, "Loading due dates"
+            )),
+            asyncio.create_task(_run_periodically(
+                _with_session(reminder_scheduler.fire_due), settings.REMINDER_TICK_SECONDS, "Sending reminders"
+            )),
+        ]
+    yield
+    for task in tasks:
+        task.cancel()
+    # Write whatever is still buffered before the process exits
+    await run_in_threadpool(activity_log.flush)
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 # Create FastAPI app
-app = FastAPI(title="Kanban Board API", version="1.0.0")
+app = FastAPI(
+    title="Kanban Board API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -18,10 +94,43 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.DATABASE_REPLICA_URL:
+    app.middleware("http")(read_your_writes)
+
+# Compress large responses such as board payloads; small ones are not worth the CPU
+compression = settings.COMPRESSION
+if compression == "br":
+    try:
+        from brotli_asgi import BrotliMiddleware
+    except ImportError:
+        logger.warning("brotli-asgi is not installed, falling back to gzip compression")
+        compression = "gzip"
+    else:
+        # Clients without Brotli support still get gzip
+        app.add_middleware(
+            BrotliMiddleware, quality=settings.COMPRESSION_LEVEL, minimum_size=settings.COMPRESSION_MIN_SIZE
+        )
+if compression == "gzip":
+    app.add_middleware(
+        GZipMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE, compresslevel=settings.COMPRESSION_LEVEL
+    )
+
+# Opt-in profiling: X-Profile request header and /api/admin endpoints
+if settings.PROFILING_ENABLED:
+    if not settings.PROFILING_TOKEN:
+        # The admin endpoints can slow down the worker and expose internals
+        raise RuntimeError("PROFILING_ENABLED requires PROFILING_TOKEN to be set")
+    app.middleware("http")(profile_requests)
 
-# Include API routers
+# Include API routers (similarity first, so /cards/similar is not taken for a card ID)
+app.include_router(similarity.router, prefix="/api", tags=["similarity"])
 app.include_router(boards.router, prefix="/api", tags=["boards"])
 app.include_router(chat.router, prefix="/api", tags=["chat"])
+app.include_router(activity.router, prefix="/api", tags=["activity"])
+app.include_router(stats.router, prefix="/api", tags=["stats"])
+app.include_router(archive.router, prefix="/api", tags=["archive"])
+if settings.PROFILING_ENABLED:
+    app.include_router(admin.router, prefix="/api", tags=["admin"])
 
 # Root endpoint
 @app.get("/")
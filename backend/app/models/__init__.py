@@ -1,9 +1,21 @@
 from app.models.board import Board
 from app.models.list import List
 from app.models.card import Card
+from app.models.chat_message import ChatMessage
+from app.models.board_change import BoardChange
+from app.models.activity_event import ActivityEvent
+from app.models.list_daily_stat import ListDailyStat
+from app.models.card_flow import CardFlow
+from app.models.archived_card import ArchivedCard
 
 __all__ = [
     "Board",
     "List",
     "Card",
+    "ChatMessage",
+    "BoardChange",
+    "ActivityEvent",
+    "ListDailyStat",
+    "CardFlow",
+    "ArchivedCard",
 ]
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Integer, DateTime, JSON, Index
+from datetime import datetime
+from app.database import Base
+
+class ActivityEvent(Base):
+    """Append-only record of who did what on a board."""
+
+    __tablename__ = "activity_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    board_id = Column(String, nullable=False)  # No FK: history outlives deleted boards
+    ts = Column(DateTime, nullable=False, default=datetime.utcnow)
+    actor = Column(String, nullable=False)  # "user" or "agent"
+    action = Column(String, nullable=False)  # e.g. "card.moved"
+    entity_id = Column(String, nullable=False)
+    details = Column(JSON, nullable=True)
+
+    __table_args__ = (
+        Index("ix_activity_events_board_id_ts", "board_id", "ts", "id"),
+        Index("ix_activity_events_ts", "ts"),
+    )
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Text, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.database import Base
+
+class ArchivedCard(Base):
+    """Cold storage for archived cards, kept out of all board queries."""
+
+    __tablename__ = "archived_cards"
+
+    id = Column(String, primary_key=True)  # ID of the original card, reused on restore
+    board_id = Column(String, ForeignKey("boards.id"), nullable=False)
+    list_id = Column(String, nullable=False)  # No FK: the list may be deleted while the card is archived
+    list_title = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    labels = Column(JSON, nullable=True)
+    due_date = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    version = Column(Integer, nullable=False, default=1)  # Card version when archived; the restored card continues from it
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    archived_by = Column(String, nullable=False)  # "user", "agent" or "policy"
+
+    __table_args__ = (
+        Index("ix_archived_cards_board_id_archived_at", "board_id", "archived_at", "id"),
+    )
+
+    # Relationships
+    board = relationship("Board", back_populates="archived_cards")
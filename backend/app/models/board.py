@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, Integer, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -11,6 +11,11 @@ class Board(Base):
     title = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    changes_pruned_through = Column(Integer, nullable=False, default=0)  # Highest change ID removed from the log
+    # When the flow counters were built; None for boards that predate them (backfilled on first stats request)
+    stats_computed_at = Column(DateTime, nullable=True, default=datetime.utcnow)
 
     # Relationships
     lists = relationship("List", back_populates="board", cascade="all, delete-orphan", order_by="List.order")
+    chat_messages = relationship("ChatMessage", back_populates="board", cascade="all, delete-orphan", order_by="ChatMessage.id")
+    archived_cards = relationship("ArchivedCard", back_populates="board", cascade="all, delete-orphan")
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Integer, DateTime, Index
+from datetime import datetime
+from app.database import Base
+
+class BoardChange(Base):
+    """Append-only change log entry; the auto-increment ID is the sync version."""
+
+    __tablename__ = "board_changes"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    board_id = Column(String, nullable=False)  # No FK: the log outlives deleted boards
+    entity = Column(String, nullable=False)  # "board", "list" or "card"
+    entity_id = Column(String, nullable=False)
+    op = Column(String, nullable=False)  # "upsert" or "delete"
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        Index("ix_board_changes_board_id_id", "board_id", "id"),
+        # Never reuse IDs of pruned entries, or versions would go backwards
+        {"sqlite_autoincrement": True},
+    )
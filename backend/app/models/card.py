@@ -13,9 +13,15 @@ class Card(Base):
     description = Column(Text, nullable=True)
     order = Column(Integer, nullable=False, default=0)
     labels = Column(JSON, nullable=True)  # Store as JSON array of strings
-    due_date = Column(DateTime, nullable=True)
+    due_date = Column(DateTime, nullable=True, index=True)
+    reminder_sent_at = Column(DateTime, nullable=True)  # Reset whenever due_date changes
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Set when the card moves to another list; existing databases start from updated_at
+    list_entered_at = Column(DateTime, default=datetime.utcnow, info={"backfill_from": "updated_at"})
+    version = Column(Integer, nullable=False, default=1)  # Bumped on every update
+
+    __mapper_args__ = {"version_id_col": version}
 
     # Relationships
     list = relationship("List", back_populates="cards")
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime, Float
+from app.database import Base
+
+class CardFlow(Base):
+    """Per-card flow timestamps used for cycle time."""
+
+    __tablename__ = "card_flows"
+
+    card_id = Column(String, primary_key=True)
+    board_id = Column(String, nullable=False, index=True)
+    first_moved_at = Column(DateTime, nullable=True)
+    done_at = Column(DateTime, nullable=True)
+    cycle_time_seconds = Column(Float, nullable=True)  # done_at - first_moved_at
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Text
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.database import Base
+
+class ChatMessage(Base):
+    __tablename__ = "chat_messages"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    board_id = Column(String, ForeignKey("boards.id"), nullable=False, index=True)
+    role = Column(String, nullable=False)  # "user" or "assistant"
+    content = Column(Text, nullable=False)
+    tool_calls = Column(JSON, nullable=True)  # Store as JSON array of {tool, input, output}
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    board = relationship("Board", back_populates="chat_messages")
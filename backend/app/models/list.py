@@ -13,6 +13,9 @@ class List(Base):
     order = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1)  # Bumped on every update
+
+    __mapper_args__ = {"version_id_col": version}
 
     # Relationships
     board = relationship("Board", back_populates="lists")
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Integer, Date, Index
+from app.database import Base
+
+class ListDailyStat(Base):
+    """Cards entering and leaving a list per day, maintained from activity events."""
+
+    __tablename__ = "list_daily_stats"
+
+    list_id = Column(String, primary_key=True)  # No FK: stats outlive deleted lists
+    day = Column(Date, primary_key=True)
+    board_id = Column(String, nullable=False)
+    entered = Column(Integer, nullable=False, default=0)
+    exited = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (Index("ix_list_daily_stats_board_id_day", "board_id", "day"),)
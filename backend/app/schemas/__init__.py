@@ -8,6 +8,7 @@ from app.schemas.board import (
     Card,
     CardCreate,
     CardUpdate,
+    CardRestore,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "Card",
     "CardCreate",
     "CardUpdate",
+    "CardRestore",
 ]
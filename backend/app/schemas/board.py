@@ -20,11 +20,15 @@ class CardUpdate(BaseModel):
     list_id: Optional[str] = None
     order: Optional[int] = None
 
+class CardRestore(BaseModel):
+    list_id: Optional[str] = None  # Defaults to the card's original list
+
 class Card(CardBase):
     id: str
     list_id: str
     order: int
     created_at: datetime
+    version: int
 
     class Config:
         from_attributes = True
@@ -46,6 +50,7 @@ class ListResponse(ListBase):
     order: int
     cards: List[Card] = []
     created_at: datetime
+    version: int
 
     class Config:
         from_attributes = True
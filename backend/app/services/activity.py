@@ -0,0 +1,146 @@
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from sqlalchemy import insert, or_, and_
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+from app.database.session import SessionLocal
+from app.models import ActivityEvent
+from app.services.stats import apply_flow_events
+
+
+class ActivityLog:
+    """Buffers activity events in memory and writes them in batches.
+
+    ``emit`` only appends to a bounded deque, so recording activity never adds
+    a write to the request transaction. The app lifespan calls ``flush``
+    periodically and on shutdown.
+    """
+
+    def __init__(self, max_buffered: int):
+        self.buffer: deque = deque(maxlen=max_buffered)
+        self.lock = threading.Lock()
+        self.dropped = 0
+
+    def emit(self, board_id: str, actor: str, action: str, entity_id: str, **details: Any) -> None:
+        """Queue an event, e.g. ``emit(board_id, "agent", "card.moved", card.id, to_list_id=...)``."""
+        event = {
+            "board_id": board_id,
+            "ts": datetime.utcnow(),
+            "actor": actor,
+            "action": action,
+            "entity_id": entity_id,
+            "details": details or None,
+        }
+        with self.lock:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append(event)
+
+    def flush(self, batch_size: int = 1000) -> int:
+        """Write all buffered events with batched INSERTs.
+
+        Board statistics are updated from the same batch in the same transaction.
+
+        Returns:
+            Number of events written
+        """
+        with self.lock:
+            events = list(self.buffer)
+            self.buffer.clear()
+        if not events:
+            return 0
+
+        db = SessionLocal()
+        try:
+            for start in range(0, len(events), batch_size):
+                db.execute(insert(ActivityEvent), events[start:start + batch_size])
+            apply_flow_events(db, events)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Keep the events for the next attempt in front of the ones emitted
+            # meanwhile; if they no longer all fit, drop the oldest
+            with self.lock:
+                events.extend(self.buffer)
+                overflow = max(0, len(events) - self.buffer.maxlen)
+                self.dropped += overflow
+                self.buffer.clear()
+                self.buffer.extend(events[overflow:])
+            raise
+        finally:
+            db.close()
+        return len(events)
+
+
+def list_activity(
+    db: Session,
+    board_id: str,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    entity_id: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Get a board's events, newest first, using keyset pagination on (ts, id).
+
+    Args:
+        db: Database session
+        board_id: Board ID
+        limit: Page size
+        cursor: ``next_cursor`` of the previous page
+        entity_id: Optional filter for a single list or card
+
+    Returns:
+        Tuple of events and the cursor for the next page (None on the last page)
+    """
+    query = db.query(
+        ActivityEvent.id, ActivityEvent.ts, ActivityEvent.actor, ActivityEvent.action,
+        ActivityEvent.entity_id, ActivityEvent.details,
+    ).filter(ActivityEvent.board_id == board_id)
+    if entity_id is not None:
+        query = query.filter(ActivityEvent.entity_id == entity_id)
+    if cursor:
+        cursor_ts, cursor_id = _parse_cursor(cursor)
+        query = query.filter(or_(
+            ActivityEvent.ts < cursor_ts,
+            and_(ActivityEvent.ts == cursor_ts, ActivityEvent.id < cursor_id),
+        ))
+
+    rows = query.order_by(ActivityEvent.ts.desc(), ActivityEvent.id.desc()).limit(limit + 1).all()
+    events = [
+        {"id": id, "ts": ts, "actor": actor, "action": action, "entity_id": event_entity_id, "details": details}
+        for id, ts, actor, action, event_entity_id, details in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = events[-1]
+        next_cursor = f"{last['ts'].isoformat()}_{last['id']}"
+    return events, next_cursor
+
+
+def _parse_cursor(cursor: str) -> Tuple[datetime, int]:
+    ts, _, id = cursor.rpartition("_")
+    return datetime.fromisoformat(ts), int(id)
+
+
+def prune_activity(db: Session, retention_days: int, batch_size: int = 10000) -> int:
+    """Delete events older than the retention period in small batches.
+
+    Batching keeps each DELETE short so it does not block concurrent flushes.
+
+    Returns:
+        Number of deleted events
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    deleted = 0
+    while True:
+        ids = [id for id, in db.query(ActivityEvent.id).filter(ActivityEvent.ts < cutoff).limit(batch_size)]
+        if not ids:
+            return deleted
+        db.query(ActivityEvent).filter(ActivityEvent.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+        deleted += len(ids)
+
+
+# Global activity log instance
+activity_log = ActivityLog(settings.ACTIVITY_BUFFER_SIZE)
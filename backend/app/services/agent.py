@@ -1,13 +1,26 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.agents import create_tool_calling_agent, AgentExecutor
-from langchain.memory import ConversationBufferMemory
+from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from sqlalchemy.orm import Session
 from app.config import settings
 from app.models import Board
+from app.services.archive import archived_card_count
+from app.services.change_log import board_version, changes_since
 from app.services.tools import create_board_tools
 
 
+def _format_card(title, card_id, description, labels, due_date, order) -> str:
+    text = f"  - Karte: {title} (ID: {card_id})\n"
+    if description:
+        text += f"    Beschreibung: {description}\n"
+    if labels:
+        text += f"    Labels: {', '.join(labels)}\n"
+    if due_date:
+        text += f"    Fällig: {due_date.strftime('%Y-%m-%d')}\n"
+    text += f"    Order: {order}\n"
+    return text
+
+
 def get_board_context(db: Session, board_id: str) -> str:
     """Build rich context string from board data.
 
@@ -23,7 +36,8 @@ def get_board_context(db: Session, board_id: str) -> str:
         return "Board nicht gefunden."
 
     context = f"Board: {board.title}\n"
-    context += f"Board ID: {board.id}\n\n"
+    context += f"Board ID: {board.id}\n"
+    context += f"Version: {board_version(db, board_id)}\n\n"
 
     # Add lists and cards
     lists = sorted(board.lists, key=lambda x: x.order)
@@ -32,25 +46,59 @@ def get_board_context(db: Session, board_id: str) -> str:
         cards = sorted(lst.cards, key=lambda x: x.order)
         if cards:
             for card in cards:
-                context += f"  - Karte: {card.title} (ID: {card.id})\n"
-                if card.description:
-                    context += f"    Beschreibung: {card.description}\n"
-                if card.labels:
-                    context += f"    Labels: {', '.join(card.labels)}\n"
-                if card.due_date:
-                    context += f"    Fällig: {card.due_date.strftime('%Y-%m-%d')}\n"
-                context += f"    Order: {card.order}\n"
+                context += _format_card(
+                    card.title, card.id, card.description, card.labels, card.due_date, card.order
+                )
         else:
             context += "  (Keine Karten)\n"
         context += "\n"
 
+    # Archived cards are never listed, only counted
+    archived = archived_card_count(db, board_id)
+    if archived:
+        context += f"Archivierte Karten: {archived} (mit search_archive() durchsuchbar)\n"
+
+    return context
+
+
+def format_board_changes(db: Session, board_id: str, since_version: int) -> str:
+    """Describe the changes of a board since a version.
+
+    Falls back to the full board context when the change log no longer
+    reaches back to ``since_version``.
+    """
+    result = changes_since(db, board_id, since_version)
+    if result is None:
+        return "Board nicht gefunden."
+    if result["snapshot"] is not None:
+        return get_board_context(db, board_id)
+    if not result["changes"]:
+        return f"Keine Änderungen seit Version {since_version}.\nVersion: {result['version']}\n"
+
+    context = f"Änderungen seit Version {since_version}:\n"
+    for change in result["changes"]:
+        data = change.get("data")
+        if change["op"] == "delete":
+            label = {"board": "Board", "list": "Liste", "card": "Karte"}[change["entity"]]
+            context += f"{label} gelöscht (ID: {change['id']})\n"
+        elif change["entity"] == "card":
+            context += f"Karte in Liste (ID: {data['list_id']}):\n"
+            context += _format_card(
+                data["title"], data["id"], data["description"], data["labels"], data["due_date"], data["order"]
+            )
+        elif change["entity"] == "list":
+            context += f"Liste: {data['title']} (ID: {data['id']}, Order: {data['order']})\n"
+        else:
+            context += f"Board: {data['title']}\n"
+    context += f"\nVersion: {result['version']}\n"
+
     return context
 
 
 def create_agent_executor(
     db: Session,
     board_id: str,
-    llm: ChatGoogleGenerativeAI
+    llm: BaseChatModel
 ) -> AgentExecutor:
     """Create agent executor for a board.
 
@@ -60,7 +108,8 @@ def create_agent_executor(
         llm: Language model instance
 
     Returns:
-        AgentExecutor configured for board operations
+        AgentExecutor configured for board operations. It holds no memory;
+        the chat history is passed in as ``chat_history`` on every call.
     """
     # Create prompt template with German instructions (without static context)
     prompt = ChatPromptTemplate.from_messages([
@@ -69,12 +118,14 @@ def create_agent_executor(
 WICHTIGE VERHALTENSREGELN:
 1. **IMMER get_board_info() nutzen**: Bevor du Aktionen planst, nutze ZUERST das get_board_info() Tool, um den aktuellen Board-Status zu sehen.
 2. **IDs merken**: Wenn du eine Liste oder Karte erstellst, wird dir die ID in der Tool-Ausgabe gegeben (z.B. "ID: abc-123"). MERKE dir diese ID für weitere Operationen!
-3. **Nach Änderungen aktualisieren**: Nach dem Erstellen/Ändern von Ressourcen, nutze get_board_info() erneut, wenn du weitere Operationen planst.
+3. **Nach Änderungen aktualisieren**: Nach dem Erstellen/Ändern von Ressourcen, nutze get_board_changes() mit der zuletzt gesehenen Version, wenn du weitere Operationen planst. Das ist günstiger als get_board_info() erneut aufzurufen.
 4. **IDs aus Ausgaben extrahieren**: Tool-Ausgaben enthalten IDs im Format "(ID: xxx)". Extrahiere und verwende diese IDs direkt.
+5. **Duplikate vermeiden**: Prüfe vor dem Erstellen einer Karte mit find_similar_cards(), ob es schon eine passende Karte gibt. Frage in dem Fall nach, statt eine zweite anzulegen.
 
 Du kannst Nutzern helfen durch:
 - Erstellen, Bearbeiten und Löschen von Karten
 - Verschieben von Karten zwischen Listen
+- Archivieren erledigter Karten und Wiederherstellen aus dem Archiv
 - Erstellen, Bearbeiten und Löschen von Listen
 - Bereitstellen von Informationen über das Board
 
@@ -97,19 +148,11 @@ Bestätige immer, was du gemacht hast. Sei präzise und hilfsbereit. Antworte im
     # Create agent
     agent = create_tool_calling_agent(llm, tools, prompt)
 
-    # Create memory
-    memory = ConversationBufferMemory(
-        memory_key="chat_history",
-        return_messages=True,
-        output_key="output"
-    )
-
     # Create agent executor
     agent_executor = AgentExecutor(
         agent=agent,
         tools=tools,
-        memory=memory,
-        verbose=True,
+        verbose=settings.LLM_VERBOSE,
         max_iterations=15,
         return_intermediate_steps=True,
         handle_parsing_errors=True
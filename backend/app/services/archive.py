@@ -0,0 +1,201 @@
+from datetime import datetime, timedelta
+from sqlalchemy import func, insert, or_, and_
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List as ListType, Optional, Tuple
+from app.config import settings
+from app.models import ArchivedCard, Card, List
+from app.services.activity import activity_log
+from app.services.change_log import record_change
+from app.services.reminders import reminder_scheduler
+
+ARCHIVE_COLUMNS = (
+    Card.id, List.board_id, Card.list_id, List.title, Card.title, Card.description,
+    Card.labels, Card.due_date, Card.created_at, Card.version,
+)
+
+
+def _archive_rows(db: Session, rows: ListType[tuple], actor: str) -> ListType[Dict[str, Any]]:
+    """Move card rows (selected with ``ARCHIVE_COLUMNS``) into the archive table and commit."""
+    now = datetime.utcnow()
+    archived = [
+        {
+            "id": card_id,
+            "board_id": board_id,
+            "list_id": list_id,
+            "list_title": list_title,
+            "title": title,
+            "description": description,
+            "labels": labels,
+            "due_date": due_date,
+            "created_at": created_at,
+            "version": version,
+            "archived_at": now,
+            "archived_by": actor,
+        }
+        for card_id, board_id, list_id, list_title, title, description, labels, due_date, created_at, version in rows
+    ]
+    if not archived:
+        return []
+
+    db.execute(insert(ArchivedCard), archived)
+    db.query(Card).filter(Card.id.in_([card["id"] for card in archived])).delete(synchronize_session=False)
+    for card in archived:
+        record_change(db, card["board_id"], "card", card["id"], "delete")
+    db.commit()
+
+    for card in archived:
+        activity_log.emit(
+            card["board_id"], actor, "card.archived", card["id"], list_id=card["list_id"], title=card["title"]
+        )
+        reminder_scheduler.cancel(card["id"])
+    return archived
+
+
+def archive_card(db: Session, card_id: str, actor: str = "user") -> Optional[Dict[str, Any]]:
+    """Move a single card into the archive.
+
+    Returns:
+        The archived card as dict, or None if the card does not exist
+    """
+    row = db.query(*ARCHIVE_COLUMNS).join(List, List.id == Card.list_id).filter(Card.id == card_id).first()
+    if row is None:
+        return None
+    return _archive_rows(db, [tuple(row)], actor)[0]
+
+
+def archive_done_cards(
+    db: Session,
+    older_than_days: int,
+    board_id: Optional[str] = None,
+    batch_size: int = 500
+) -> int:
+    """Archive cards that have been sitting in a "Done" list for a while.
+
+    A card qualifies when it has been in a list titled like ``STATS_DONE_LISTS``
+    for ``older_than_days``. Edits and reordering within the list do not
+    restart the clock.
+
+    Args:
+        db: Database session
+        older_than_days: Minimum days since the card entered its list
+        board_id: Optional board ID; all boards when omitted
+        batch_size: Cards moved per transaction
+
+    Returns:
+        Number of archived cards
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    query = db.query(*ARCHIVE_COLUMNS).join(List, List.id == Card.list_id).filter(
+        func.lower(List.title).in_(settings.done_list_titles),
+        Card.list_entered_at < cutoff,
+    )
+    if board_id is not None:
+        query = query.filter(List.board_id == board_id)
+
+    archived = 0
+    while True:
+        rows = [tuple(row) for row in query.limit(batch_size)]
+        if not rows:
+            return archived
+        archived += len(_archive_rows(db, rows, "policy"))
+
+
+def search_archive(
+    db: Session,
+    board_id: str,
+    query: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Tuple[ListType[Dict[str, Any]], Optional[str]]:
+    """Search a board's archived cards, most recently archived first.
+
+    Args:
+        db: Database session
+        board_id: Board ID
+        query: Optional text matched against title and description
+        limit: Page size
+        cursor: ``next_cursor`` of the previous page
+
+    Returns:
+        Tuple of archived cards and the cursor for the next page (None on the last page)
+    """
+    rows = db.query(ArchivedCard).filter(ArchivedCard.board_id == board_id)
+    if query:
+        pattern = f"%{query}%"
+        rows = rows.filter(or_(ArchivedCard.title.ilike(pattern), ArchivedCard.description.ilike(pattern)))
+    if cursor:
+        cursor_ts, _, cursor_id = cursor.rpartition("_")
+        cursor_ts = datetime.fromisoformat(cursor_ts)
+        rows = rows.filter(or_(
+            ArchivedCard.archived_at < cursor_ts,
+            and_(ArchivedCard.archived_at == cursor_ts, ArchivedCard.id < cursor_id),
+        ))
+
+    rows = rows.order_by(ArchivedCard.archived_at.desc(), ArchivedCard.id.desc()).limit(limit + 1).all()
+    cards = [
+        {column.name: getattr(row, column.name) for column in ArchivedCard.__table__.columns}
+        for row in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = cards[-1]
+        next_cursor = f"{last['archived_at'].isoformat()}_{last['id']}"
+    return cards, next_cursor
+
+
+def restore_card(db: Session, card_id: str, list_id: Optional[str] = None, actor: str = "user") -> Optional[Card]:
+    """Move an archived card back onto its board, at the end of the target list.
+
+    The card goes to ``list_id`` if given, otherwise to its original list, or
+    to the board's first list if that was deleted in the meantime.
+
+    Returns:
+        The restored card, or None if no archived card has this ID
+
+    Raises:
+        ValueError: If the target list does not exist on the card's board
+    """
+    archived = db.query(ArchivedCard).filter(ArchivedCard.id == card_id).first()
+    if archived is None:
+        return None
+
+    lists = db.query(List).filter(List.board_id == archived.board_id)
+    if list_id is not None:
+        target = lists.filter(List.id == list_id).first()
+    else:
+        target = lists.filter(List.id == archived.list_id).first() or lists.order_by(List.order).first()
+    if target is None:
+        raise ValueError("Target list not found on the card's board")
+
+    now = datetime.utcnow()
+    card = Card(
+        id=archived.id,
+        list_id=target.id,
+        title=archived.title,
+        description=archived.description,
+        order=db.query(Card).filter(Card.list_id == target.id).count(),
+        labels=archived.labels,
+        due_date=archived.due_date,
+        # Do not remind about deadlines that passed while the card was archived
+        reminder_sent_at=now if archived.due_date is not None and archived.due_date <= now else None,
+        created_at=archived.created_at,
+    )
+    db.add(card)
+    db.flush()
+    # Continue above any version a client may still hold, so stale ETags and If-Match fail.
+    # The mapper always inserts version 1, hence the separate update.
+    db.query(Card).filter(Card.id == card.id).update(
+        {Card.version: archived.version + 1}, synchronize_session=False
+    )
+    db.delete(archived)
+    record_change(db, target.board_id, "card", card.id)
+    db.commit()
+    activity_log.emit(target.board_id, actor, "card.restored", card.id, list_id=target.id, title=card.title)
+    db.refresh(card)
+    if card.reminder_sent_at is None and card.due_date is not None:
+        reminder_scheduler.schedule(card.id, card.due_date)
+    return card
+
+
+def archived_card_count(db: Session, board_id: str) -> int:
+    return db.query(func.count(ArchivedCard.id)).filter(ArchivedCard.board_id == board_id).scalar()
@@ -0,0 +1,130 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List as ListType, Optional, Sequence
+from app.models import Board, List, Card
+
+
+DESCRIPTION_PREVIEW_CHARS = 120
+
+# Card fields a client can pick with ``fields``; id, list_id, order and version are always included
+CARD_FIELDS = {
+    "title": Card.title,
+    "description": Card.description,
+    "description_preview": func.substr(Card.description, 1, DESCRIPTION_PREVIEW_CHARS),
+    "labels": Card.labels,
+    "due_date": Card.due_date,
+    "created_at": Card.created_at,
+}
+DEFAULT_CARD_FIELDS = ("title", "description", "labels", "due_date", "created_at")
+
+
+def board_payloads(
+    db: Session,
+    board_id: Optional[str] = None,
+    card_fields: Sequence[str] = DEFAULT_CARD_FIELDS
+) -> ListType[Dict[str, Any]]:
+    """Build board response dicts straight from column rows.
+
+    Produces the same shape as ``schemas.Board`` without loading ORM objects
+    or validating them through Pydantic. All lists and cards are fetched with
+    a single joined query.
+
+    Args:
+        db: Database session
+        board_id: Optional board ID; all boards when omitted
+        card_fields: Card fields to include (keys of ``CARD_FIELDS``); only
+            these columns are read, e.g. to leave out long descriptions
+
+    Returns:
+        List of board dicts ready for JSON encoding
+    """
+    boards_query = db.query(Board.id, Board.title, Board.created_at)
+    rows_query = (
+        db.query(
+            List.id, List.board_id, List.title, List.order, List.created_at, List.version,
+            Card.id, Card.order, Card.version, *(CARD_FIELDS[field] for field in card_fields),
+        )
+        .outerjoin(Card, Card.list_id == List.id)
+        .order_by(List.order, List.id, Card.order)
+    )
+    if board_id is not None:
+        boards_query = boards_query.filter(Board.id == board_id)
+        rows_query = rows_query.filter(List.board_id == board_id)
+
+    boards = {
+        id: {"title": title, "id": id, "lists": [], "created_at": created_at}
+        for id, title, created_at in boards_query
+    }
+    if not boards:
+        return []
+
+    lists: Dict[str, Dict[str, Any]] = {}
+    for (
+        list_id, list_board_id, list_title, list_order, list_created_at, list_version,
+        card_id, card_order, card_version, *values,
+    ) in rows_query:
+        lst = lists.get(list_id)
+        if lst is None:
+            lst = lists[list_id] = {
+                "title": list_title,
+                "id": list_id,
+                "board_id": list_board_id,
+                "order": list_order,
+                "cards": [],
+                "created_at": list_created_at,
+                "version": list_version,
+            }
+            boards[list_board_id]["lists"].append(lst)
+        if card_id is not None:
+            card = dict(zip(card_fields, values))
+            card["id"] = card_id
+            card["list_id"] = list_id
+            card["order"] = card_order
+            card["version"] = card_version
+            lst["cards"].append(card)
+
+    return list(boards.values())
+
+
+def card_payloads(db: Session, card_ids: ListType[str]) -> Dict[str, Dict[str, Any]]:
+    """Build ``schemas.Card`` shaped dicts for the given cards, keyed by ID."""
+    if not card_ids:
+        return {}
+    rows = db.query(
+        Card.id, Card.list_id, Card.title, Card.description, Card.order, Card.labels,
+        Card.due_date, Card.created_at, Card.version,
+    ).filter(Card.id.in_(card_ids))
+    return {
+        card_id: {
+            "title": title,
+            "description": description,
+            "labels": labels,
+            "due_date": due_date,
+            "id": card_id,
+            "list_id": list_id,
+            "order": order,
+            "created_at": created_at,
+            "version": version,
+        }
+        for card_id, list_id, title, description, order, labels, due_date, created_at, version in rows
+    }
+
+
+def list_payloads(db: Session, list_ids: ListType[str]) -> Dict[str, Dict[str, Any]]:
+    """Build list dicts without their cards for the given lists, keyed by ID."""
+    if not list_ids:
+        return {}
+    rows = db.query(
+        List.id, List.board_id, List.title, List.order, List.created_at, List.version,
+    ).filter(List.id.in_(list_ids))
+    return {
+        list_id: {
+            "title": title,
+            "id": list_id,
+            "board_id": board_id,
+            "order": order,
+            "created_at": created_at,
+            "version": version,
+        }
+        for list_id, board_id, title, order, created_at, version in rows
+    }
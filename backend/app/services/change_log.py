@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional, Tuple
+from app.models import Board, BoardChange
+from app.services.board_payload import board_payloads, card_payloads, list_payloads
+
+
+def record_change(db: Session, board_id: str, entity: str, entity_id: str, op: str = "upsert") -> None:
+    """Append a change to the board's log.
+
+    The entry is only added to the session, so it is committed (or rolled
+    back) together with the mutation it describes.
+
+    Change IDs are the sync cursor, so they must become visible in ID order.
+    Databases with concurrent writers (Postgres) assign IDs at insert time,
+    not at commit, so the board row is locked first: writers of one board
+    then insert and commit one after the other. SQLite has a single writer
+    and needs no lock.
+
+    Args:
+        db: Database session
+        board_id: Board the entity belongs to
+        entity: "board", "list" or "card"
+        entity_id: ID of the changed entity
+        op: "upsert" or "delete"
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        # Lock before flushing the pending mutation, so the board lock is always taken first
+        with db.no_autoflush:
+            db.query(Board.id).filter(Board.id == board_id).with_for_update(key_share=True).first()
+    db.add(BoardChange(board_id=board_id, entity=entity, entity_id=entity_id, op=op))
+
+
+def board_version(db: Session, board_id: str) -> int:
+    """Latest change ID of a board, or its pruned mark if the log is empty.
+
+    It changes whenever the board payload does, so it serves as an ETag and
+    as the ``since`` cursor of ``changes_since``.
+    """
+    latest = db.query(func.max(BoardChange.id)).filter(BoardChange.board_id == board_id).scalar()
+    pruned = db.query(Board.changes_pruned_through).filter(Board.id == board_id).scalar()
+    return max(latest or 0, pruned or 0)
+
+
+def all_boards_version(db: Session) -> str:
+    """ETag source for all boards together.
+
+    Changes of different boards are not ordered by commit, so a change
+    committed late with a lower ID would not move the maximum; the entry
+    count catches it.
+    """
+    latest, count = db.query(func.max(BoardChange.id), func.count(BoardChange.id)).one()
+    return f"{latest or 0}.{count}"
+
+
+def changes_since(db: Session, board_id: str, since: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Get compacted changes of a board after version ``since``.
+
+    Only the last change per entity is returned, with the entity's current
+    state for upserts. When ``since`` is missing or older than the pruned part
+    of the log, a full snapshot is returned instead.
+
+    Returns:
+        Dict with 'version', 'snapshot' and 'changes' keys, or None if the board does not exist
+    """
+    board = db.query(Board.changes_pruned_through).filter(Board.id == board_id).first()
+    if not board:
+        return None
+
+    if since is None or since < board.changes_pruned_through:
+        return {"version": board_version(db, board_id), "snapshot": board_payloads(db, board_id)[0], "changes": []}
+
+    rows = db.query(BoardChange.id, BoardChange.entity, BoardChange.entity_id, BoardChange.op).filter(
+        BoardChange.board_id == board_id, BoardChange.id > since
+    ).order_by(BoardChange.id)
+
+    version = since
+    latest: Dict[Tuple[str, str], str] = {}  # (entity, entity_id) -> last op, in order of last change
+    for change_id, entity, entity_id, op in rows:
+        version = change_id
+        latest.pop((entity, entity_id), None)
+        latest[(entity, entity_id)] = op
+
+    upserted = {"board": [], "list": [], "card": []}
+    for (entity, entity_id), op in latest.items():
+        if op == "upsert":
+            upserted[entity].append(entity_id)
+    current = {
+        "board": {
+            id: {"title": title, "id": id, "created_at": created_at}
+            for id, title, created_at in (
+                db.query(Board.id, Board.title, Board.created_at).filter(Board.id == board_id)
+                if upserted["board"] else []
+            )
+        },
+        "list": list_payloads(db, upserted["list"]),
+        "card": card_payloads(db, upserted["card"]),
+    }
+
+    changes = []
+    for (entity, entity_id), op in latest.items():
+        data = current[entity].get(entity_id) if op == "upsert" else None
+        if data is None:
+            # Deleted (e.g. by a cascade) after the logged upsert
+            changes.append({"entity": entity, "id": entity_id, "op": "delete"})
+        else:
+            changes.append({"entity": entity, "id": entity_id, "op": "upsert", "data": data})
+
+    return {"version": version, "snapshot": None, "changes": changes}
+
+
+def prune_change_log(db: Session, retention_days: int) -> int:
+    """Delete log entries older than the retention period.
+
+    Each board remembers the highest pruned change ID so that clients syncing
+    from before it get a full snapshot instead of an incomplete delta.
+
+    Returns:
+        Number of deleted entries
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    pruned = db.query(BoardChange.board_id, func.max(BoardChange.id)).filter(
+        BoardChange.created_at < cutoff
+    ).group_by(BoardChange.board_id).all()
+
+    for board_id, max_id in pruned:
+        db.query(Board).filter(Board.id == board_id).update(
+            {Board.changes_pruned_through: max_id}, synchronize_session=False
+        )
+    deleted = db.query(BoardChange).filter(BoardChange.created_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+    return deleted
@@ -1,51 +1,76 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.agents import AgentExecutor
-from langchain.memory import ConversationBufferMemory
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from sqlalchemy.orm import Session
-from typing import Dict, List
+from typing import Dict, List, Optional
+import threading
 from app.config import settings
+from app.models import ChatMessage
 from app.services.agent import create_agent_executor
+from app.services.chat_history import clear_chat_history
+from app.services.llm import create_llm
+from app.services.profiling import deep_sizeof
+from app.services.recording import ConversationRecorder
 
 
-class ChatService:
-    """AI Chat service using LangChain with Google Gemini for board operations."""
-
-    def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            google_api_key=settings.GEMINI_API_KEY,
-            temperature=0.7
-        )
-        self.agents: Dict[str, AgentExecutor] = {}  # board_id -> agent executor
-        self.memories: Dict[str, ConversationBufferMemory] = {}  # board_id -> memory
-        self.full_messages: Dict[str, List[Dict]] = {}  # board_id -> full messages with tool_calls
-
-    def _get_or_create_agent(self, db: Session, board_id: str) -> AgentExecutor:
-        """Get or create agent executor for a board."""
-        if board_id not in self.agents:
-            # Create agent executor using the agent module
-            agent_executor = create_agent_executor(db, board_id, self.llm)
-            self.agents[board_id] = agent_executor
+class ReleaseTransactionCallback(BaseCallbackHandler):
+    """Ends the session's transaction before every model call.
+
+    Tools commit their own writes, but reads leave a transaction open; without
+    this it would hold the connection (the only writer connection with the
+    tuned SQLite profile) for as long as the LLM takes to answer.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
 
-            # Store memory reference
-            self.memories[board_id] = agent_executor.memory
+    def on_chat_model_start(self, *args, **kwargs) -> None:
+        self.db.commit()
 
-        return self.agents[board_id]
 
-    def send_message(self, db: Session, board_id: str, message: str) -> Dict:
+class ChatService:
+    """AI Chat service using LangChain with a configurable LLM for board operations.
+
+    Conversations are stored in the ``chat_messages`` table rather than in
+    process memory, so any worker process can continue any board's chat.
+    """
+
+    def __init__(self, llm: Optional[BaseChatModel] = None):
+        self.llm = llm or create_llm()
+        self.recorder = ConversationRecorder(settings.LLM_RECORD_DIR) if settings.LLM_RECORD_DIR else None
+
+    def _load_chat_history(self, db: Session, board_id: str) -> List[BaseMessage]:
+        """Load the stored conversation as LangChain messages for the agent prompt."""
+        messages = db.query(ChatMessage.role, ChatMessage.content).filter(
+            ChatMessage.board_id == board_id
+        ).order_by(ChatMessage.id)
+        return [
+            HumanMessage(content=content) if role == 'user' else AIMessage(content=content)
+            for role, content in messages
+        ]
+
+    def send_message(
+        self,
+        db: Session,
+        board_id: str,
+        message: str,
+        callbacks: Optional[List[BaseCallbackHandler]] = None
+    ) -> Dict:
         """Send a message to the AI and get a response with automatic function calling.
 
         Args:
             db: Database session
             board_id: Board ID for context
             message: User message
+            callbacks: Optional LangChain callbacks for this turn
 
         Returns:
             Dict with 'response' and 'actions_taken' keys
         """
         try:
-            # Get or create agent for this board
-            agent_executor = self._get_or_create_agent(db, board_id)
+            # Agents are cheap to build and bound to this request's session
+            agent_executor = create_agent_executor(db, board_id, self.llm)
+            chat_history = self._load_chat_history(db, board_id)
 
             # Refresh board context before execution
             # This ensures the agent sees the latest state via get_board_info() tool
@@ -56,8 +81,16 @@ class ChatService:
             # (Agent is instructed to use get_board_info() tool, but we provide fallback)
             enhanced_input = f"{message}"
 
+            callbacks = [ReleaseTransactionCallback(db), *(callbacks or [])]
+            turn = self.recorder.start_turn(db, board_id) if self.recorder else None
+            if turn:
+                callbacks.append(turn)
+
             # Execute agent with potentially enhanced input
-            result = agent_executor.invoke({"input": enhanced_input})
+            result = agent_executor.invoke(
+                {"input": enhanced_input, "chat_history": chat_history},
+                config={"callbacks": callbacks}
+            )
 
             # Extract actions taken and tool calls from intermediate steps
             actions_taken = []
@@ -77,21 +110,17 @@ class ChatService:
                         })
 
             # Store full message history with tool_calls for persistence
-            if board_id not in self.full_messages:
-                self.full_messages[board_id] = []
-
-            # Add user message
-            self.full_messages[board_id].append({
-                'role': 'user',
-                'content': message
-            })
-
-            # Add assistant message with tool_calls
-            self.full_messages[board_id].append({
-                'role': 'assistant',
-                'content': result.get('output', ''),
-                'tool_calls': tool_calls
-            })
+            db.add(ChatMessage(board_id=board_id, role='user', content=message))
+            db.add(ChatMessage(
+                board_id=board_id,
+                role='assistant',
+                content=result.get('output', ''),
+                tool_calls=tool_calls
+            ))
+            db.commit()
+
+            if turn:
+                self.recorder.finish_turn(board_id, turn, message, tool_calls, result.get('output', ''))
 
             return {
                 'response': result.get('output', ''),
@@ -100,41 +129,38 @@ class ChatService:
             }
 
         except Exception as e:
+            db.rollback()
             return {
                 'response': f"Entschuldigung, da ist ein Fehler aufgetreten: {str(e)}",
                 'actions_taken': []
             }
 
-    def get_history(self, board_id: str) -> List[Dict]:
-        """Get chat history for a board.
+    def cache_sizes(self) -> Dict[str, int]:
+        """Approximate bytes of in-memory chat state per board (only recordings are kept)."""
+        if not self.recorder:
+            return {}
+        return {board_id: deep_sizeof(recording) for board_id, recording in self.recorder.recordings.items()}
 
-        Returns:
-            List of messages with 'role', 'content', and optionally 'tool_calls' keys
-        """
-        # Return full messages with tool_calls if available
-        if board_id in self.full_messages:
-            return self.full_messages[board_id]
+    def clear_history(self, db: Session, board_id: str) -> bool:
+        """Clear chat history for a board (see ``clear_chat_history``)."""
+        return clear_chat_history(db, board_id)
 
-        return []
 
-    def clear_history(self, board_id: str) -> bool:
-        """Clear chat history for a board.
+# Global chat service instance, created on first chat use
+_chat_service: Optional[ChatService] = None
+_chat_service_lock = threading.Lock()
 
-        Returns:
-            True if cleared, False if no session existed
-        """
-        cleared = False
-        if board_id in self.agents:
-            del self.agents[board_id]
-            cleared = True
-        if board_id in self.memories:
-            del self.memories[board_id]
-            cleared = True
-        if board_id in self.full_messages:
-            del self.full_messages[board_id]
-            cleared = True
-        return cleared
-
-
-# Global chat service instance
-chat_service = ChatService()
+
+def get_chat_service() -> ChatService:
+    """Get the global chat service, creating the LLM client on first call."""
+    global _chat_service
+    if _chat_service is None:
+        with _chat_service_lock:
+            if _chat_service is None:
+                _chat_service = ChatService()
+    return _chat_service
+
+
+def created_chat_service() -> Optional[ChatService]:
+    """Get the global chat service only if it was already created."""
+    return _chat_service
@@ -0,0 +1,38 @@
+import sys
+from sqlalchemy.orm import Session
+from typing import Dict, List
+from app.models import ChatMessage
+
+
+def get_chat_history(db: Session, board_id: str) -> List[Dict]:
+    """Get chat history for a board.
+
+    Only reads the database, so it works without loading LangChain or an LLM client.
+
+    Returns:
+        List of messages with 'role', 'content', and optionally 'tool_calls' keys
+    """
+    messages = db.query(ChatMessage).filter(
+        ChatMessage.board_id == board_id
+    ).order_by(ChatMessage.id).all()
+    return [
+        {'role': msg.role, 'content': msg.content, 'tool_calls': msg.tool_calls}
+        if msg.role == 'assistant' else {'role': msg.role, 'content': msg.content}
+        for msg in messages
+    ]
+
+
+def clear_chat_history(db: Session, board_id: str) -> bool:
+    """Clear chat history for a board.
+
+    Returns:
+        True if cleared, False if no session existed
+    """
+    deleted = db.query(ChatMessage).filter(ChatMessage.board_id == board_id).delete()
+    db.commit()
+    # A recording of the conversation only exists once this process created the chat service
+    chat = sys.modules.get("app.services.chat")
+    chat_service = chat.created_chat_service() if chat else None
+    if chat_service is not None and chat_service.recorder:
+        chat_service.recorder.discard(board_id)
+    return deleted > 0
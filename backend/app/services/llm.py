@@ -0,0 +1,86 @@
+import json
+from typing import Any, Dict, List, Optional
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+from app.config import settings
+
+
+class ReplayExhaustedError(RuntimeError):
+    """Raised when the agent asks for more LLM responses than were recorded."""
+
+
+class ReplayChatModel(BaseChatModel):
+    """Chat model that plays back recorded LLM responses in order.
+
+    Tool call arguments are rewritten through ``id_map`` so that IDs generated
+    during the original session can be mapped onto the IDs created on replay.
+    """
+
+    responses: List[Dict[str, Any]]
+    cursor: int = 0
+    id_map: Dict[str, str] = {}
+
+    @classmethod
+    def from_file(cls, path: str) -> "ReplayChatModel":
+        """Load all LLM responses of a recording file."""
+        with open(path, encoding="utf-8") as f:
+            recording = json.load(f)
+
+        responses = [
+            call["response"]
+            for turn in recording["turns"]
+            for call in turn["llm_calls"]
+        ]
+        return cls(responses=responses)
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.cursor >= len(self.responses):
+            raise ReplayExhaustedError(
+                f"Recording exhausted after {len(self.responses)} LLM responses"
+            )
+
+        message = messages_from_dict([self.responses[self.cursor]])[0]
+        self.cursor += 1
+
+        for tool_call in getattr(message, "tool_calls", []):
+            tool_call["args"] = {
+                key: self.id_map.get(value, value) if isinstance(value, str) else value
+                for key, value in tool_call["args"].items()
+            }
+
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ReplayChatModel":
+        # Recorded responses already carry their tool calls
+        return self
+
+
+def create_llm() -> BaseChatModel:
+    """Create the chat model configured by ``settings.LLM_PROVIDER``."""
+    if settings.LLM_PROVIDER == "replay":
+        if not settings.LLM_REPLAY_FILE:
+            raise ValueError("LLM_REPLAY_FILE must be set for LLM_PROVIDER=replay")
+        return ReplayChatModel.from_file(settings.LLM_REPLAY_FILE)
+
+    if settings.LLM_PROVIDER == "gemini":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=settings.LLM_MODEL,
+            google_api_key=settings.GEMINI_API_KEY,
+            temperature=settings.LLM_TEMPERATURE
+        )
+
+    raise ValueError(f"Unknown LLM_PROVIDER: {settings.LLM_PROVIDER}")
@@ -0,0 +1,260 @@
+import asyncio
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import re
+import secrets
+import sys
+import threading
+import tracemalloc
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+from fastapi import Request
+from fastapi.routing import APIRoute
+from starlette.routing import request_response
+from typing import Any, Callable, Dict, List, Optional
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"  # Request: "1", "cprofile" or "pyinstrument"; response: profile file name
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+PROFILE_NAME_PATTERN = re.compile(r"^[\w.-]+\.(prof|html)$")
+
+_capture: ContextVar[Optional["ProfileCapture"]] = ContextVar("profile_capture", default=None)
+
+
+class ProfileCapture:
+    """Profiles one request's endpoint call and writes the result to ``PROFILING_DIR``."""
+
+    def __init__(self, profiler: str):
+        self.profiler = profiler
+        self.name: Optional[str] = None
+
+    def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        if self.profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                logger.warning("pyinstrument is not installed, profiling with cProfile")
+            else:
+                profiler = Profiler()
+                profiler.start()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profiler.stop()
+                    self._write("html", lambda path: _write_text(path, profiler.output_html()))
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            self._write("prof", profiler.dump_stats)
+
+    def _write(self, suffix: str, write: Callable[[str], Any]) -> None:
+        os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+        self.name = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{os.getpid()}-{uuid.uuid4().hex[:8]}.{suffix}"
+        write(os.path.join(settings.PROFILING_DIR, self.name))
+
+
+def _write_text(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _profiled(call: Callable) -> Callable:
+    @functools.wraps(call)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        capture = _capture.get()
+        if capture is None:
+            return call(*args, **kwargs)
+        return capture.run(call, *args, **kwargs)
+    return run
+
+
+class ProfiledRoute(APIRoute):
+    """Route whose endpoint can run under a profiler when the request asks for it.
+
+    Sync endpoints run in a threadpool thread, out of reach of a profiler
+    started in middleware, so the endpoint call itself is wrapped. Without
+    ``PROFILING_ENABLED`` the route is a plain ``APIRoute``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        if settings.PROFILING_ENABLED and not asyncio.iscoroutinefunction(self.dependant.call):
+            self.dependant.call = _profiled(self.dependant.call)
+            self.app = request_response(self.get_route_handler())
+
+
+def is_admin(token: Optional[str]) -> bool:
+    # Never open to everyone, even if the startup check was bypassed
+    return bool(settings.PROFILING_TOKEN) and secrets.compare_digest(token or "", settings.PROFILING_TOKEN)
+
+
+async def profile_requests(request: Request, call_next):
+    """Profile requests sent with an ``X-Profile`` header.
+
+    The response names the written profile in its own ``X-Profile`` header;
+    fetch it from GET /admin/profiles/{name}.
+    """
+    requested = request.headers.get(PROFILE_HEADER)
+    if not requested or not is_admin(request.headers.get(ADMIN_TOKEN_HEADER)):
+        return await call_next(request)
+
+    capture = ProfileCapture(requested if requested in ("cprofile", "pyinstrument") else settings.PROFILER)
+    token = _capture.set(capture)
+    try:
+        response = await call_next(request)
+    finally:
+        _capture.reset(token)
+    if capture.name:
+        response.headers[PROFILE_HEADER] = capture.name
+    return response
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    if not os.path.isdir(settings.PROFILING_DIR):
+        return []
+    return [
+        {"name": entry.name, "bytes": entry.stat().st_size}
+        for entry in sorted(os.scandir(settings.PROFILING_DIR), key=lambda entry: entry.name, reverse=True)
+        if PROFILE_NAME_PATTERN.match(entry.name)
+    ]
+
+
+def profile_path(name: str) -> Optional[str]:
+    """Path of a written profile, or None for unknown or unsafe names."""
+    if not PROFILE_NAME_PATTERN.match(name):
+        return None
+    path = os.path.join(settings.PROFILING_DIR, name)
+    return path if os.path.isfile(path) else None
+
+
+def profile_summary(path: str, limit: int = 40) -> str:
+    """Top functions of a cProfile dump by cumulative time."""
+    output = io.StringIO()
+    pstats.Stats(path, stream=output).sort_stats("cumulative").print_stats(limit)
+    return output.getvalue()
+
+
+class MemoryProfiler:
+    """tracemalloc snapshots; each one is compared with the previous to show growth."""
+
+    def __init__(self):
+        self.previous: Optional[tracemalloc.Snapshot] = None
+        self.lock = threading.Lock()
+
+    def snapshot(self, limit: int = 25, group_by: str = "lineno") -> Dict[str, Any]:
+        """Take a snapshot, starting tracing on the first call.
+
+        Returns:
+            Dict with traced and RSS bytes, the top allocation sites and the
+            sites that grew most since the previous snapshot
+        """
+        with self.lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(settings.TRACEMALLOC_FRAMES)
+                return {"pid": os.getpid(), "tracing": "started", "rss_bytes": _rss_bytes()}
+
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            growth = snapshot.compare_to(self.previous, group_by)[:limit] if self.previous else []
+            self.previous = snapshot
+
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "pid": os.getpid(),
+            "tracing": "running",
+            "rss_bytes": _rss_bytes(),
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+            "top": [_format_stat(stat) for stat in snapshot.statistics(group_by)[:limit]],
+            "growth": [
+                {**_format_stat(stat), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in growth
+            ],
+        }
+
+    def stop(self) -> None:
+        with self.lock:
+            tracemalloc.stop()
+            self.previous = None
+
+
+def _format_stat(stat) -> Dict[str, Any]:
+    return {
+        "where": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+        "size": stat.size,
+        "count": stat.count,
+    }
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Approximate memory held by an object and the containers it references.
+
+    Follows dicts, lists, tuples and sets; objects reachable through several
+    paths are counted once.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+def cache_report() -> Dict[str, Any]:
+    """Size of the in-process caches, per board where they are kept per board.
+
+    The chat service is only inspected if it was already created, so this
+    never loads LangChain.
+    """
+    from app.services.activity import activity_log
+    from app.services.reminders import reminder_scheduler
+    from app.services.similarity import similarity_index
+
+    boards: Dict[str, Dict[str, int]] = {}
+    chat = sys.modules.get("app.services.chat")
+    chat_service = chat.created_chat_service() if chat else None
+    if chat_service is not None:
+        for board_id, size in chat_service.cache_sizes().items():
+            boards.setdefault(board_id, {})["chat_recording_bytes"] = size
+    for board_id, size in similarity_index.cache_sizes().items():
+        boards.setdefault(board_id, {})["similarity_index_bytes"] = size
+
+    return {
+        "pid": os.getpid(),
+        "rss_bytes": _rss_bytes(),
+        "boards": boards,
+        "activity_buffer_events": len(activity_log.buffer),
+        "reminders_pending": len(reminder_scheduler.pending),
+    }
+
+
+# Global memory profiler instance
+memory_profiler = MemoryProfiler()
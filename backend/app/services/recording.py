@@ -0,0 +1,160 @@
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage, message_to_dict, messages_to_dict
+from langchain_core.outputs import LLMResult
+from sqlalchemy.orm import Session
+from app.models import Board, List as BoardList, Card
+
+ID_PATTERN = re.compile(r"ID: ([0-9a-fA-F-]{36})")
+
+
+def snapshot_board(db: Session, board_id: str) -> Optional[Dict[str, Any]]:
+    """Capture a board with all lists and cards, including their IDs."""
+    board = db.query(Board).filter(Board.id == board_id).first()
+    if not board:
+        return None
+
+    return {
+        "id": board.id,
+        "title": board.title,
+        "lists": [
+            {
+                "id": lst.id,
+                "title": lst.title,
+                "order": lst.order,
+                "cards": [
+                    {
+                        "id": card.id,
+                        "title": card.title,
+                        "description": card.description,
+                        "order": card.order,
+                        "labels": card.labels,
+                        "due_date": card.due_date.isoformat() if card.due_date else None,
+                    }
+                    for card in lst.cards
+                ],
+            }
+            for lst in board.lists
+        ],
+    }
+
+
+def seed_board(db: Session, snapshot: Dict[str, Any]) -> Board:
+    """Recreate a board from a snapshot, keeping the recorded IDs."""
+    board = Board(id=snapshot["id"], title=snapshot["title"])
+    db.add(board)
+    for lst in snapshot["lists"]:
+        db.add(BoardList(id=lst["id"], board_id=board.id, title=lst["title"], order=lst["order"]))
+        for card in lst["cards"]:
+            db.add(Card(
+                id=card["id"],
+                list_id=lst["id"],
+                title=card["title"],
+                description=card["description"],
+                order=card["order"],
+                labels=card["labels"],
+                due_date=datetime.fromisoformat(card["due_date"]) if card["due_date"] else None,
+            ))
+    db.commit()
+    return board
+
+
+class TurnRecorder(BaseCallbackHandler):
+    """Collects the prompt and response of every LLM call during one chat turn."""
+
+    def __init__(self):
+        self.llm_calls: List[Dict[str, Any]] = []
+        self._prompt: List[Dict[str, Any]] = []
+
+    def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: List[List[BaseMessage]], **kwargs: Any
+    ) -> None:
+        self._prompt = messages_to_dict(messages[0])
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        generation = response.generations[0][0]
+        self.llm_calls.append({
+            "prompt": self._prompt,
+            "response": message_to_dict(generation.message),
+        })
+
+
+class ConversationRecorder:
+    """Writes chat conversations to ``<directory>/<board_id>.json``.
+
+    Each file holds a snapshot of the board taken before the first turn and
+    every turn's LLM calls, tool calls and final output, which is everything
+    ``replay.py`` needs to play the conversation back offline.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.recordings: Dict[str, Dict[str, Any]] = {}  # board_id -> recording
+
+    def start_turn(self, db: Session, board_id: str) -> TurnRecorder:
+        if board_id not in self.recordings:
+            self.recordings[board_id] = {
+                "board": snapshot_board(db, board_id),
+                "turns": [],
+            }
+        return TurnRecorder()
+
+    def finish_turn(
+        self,
+        board_id: str,
+        turn: TurnRecorder,
+        message: str,
+        tool_calls: List[Dict[str, Any]],
+        output: str
+    ) -> None:
+        recording = self.recordings[board_id]
+        recording["turns"].append({
+            "input": message,
+            "llm_calls": turn.llm_calls,
+            "tool_calls": tool_calls,
+            "output": output,
+        })
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, f"{board_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(recording, f, ensure_ascii=False, indent=2, default=str)
+
+    def discard(self, board_id: str) -> None:
+        """Start a fresh recording on the next turn, e.g. after the history was cleared."""
+        self.recordings.pop(board_id, None)
+
+
+class ReplayChecker(BaseCallbackHandler):
+    """Compares tool outputs during replay against the recorded ones.
+
+    IDs generated on replay differ from the recorded ones, so every pair of
+    IDs found at the same position in the expected and actual output is added
+    to ``id_map``, which the replay model uses to rewrite later tool calls.
+    """
+
+    def __init__(self, expected_outputs: List[str], id_map: Dict[str, str]):
+        self.expected_outputs = expected_outputs
+        self.id_map = id_map
+        self.index = 0
+        self.mismatches: List[Dict[str, str]] = []
+
+    def on_tool_end(self, output: Any, **kwargs: Any) -> None:
+        actual = str(getattr(output, "content", output))
+        if self.index >= len(self.expected_outputs):
+            self.mismatches.append({"expected": "", "actual": actual})
+            return
+
+        expected = self.expected_outputs[self.index]
+        self.index += 1
+
+        for recorded_id, replayed_id in zip(ID_PATTERN.findall(expected), ID_PATTERN.findall(actual)):
+            if recorded_id != replayed_id:
+                self.id_map.setdefault(recorded_id, replayed_id)
+
+        normalised = ID_PATTERN.sub(lambda m: f"ID: {self.id_map.get(m.group(1), m.group(1))}", expected)
+        if normalised != actual:
+            self.mismatches.append({"expected": normalised, "actual": actual})
@@ -0,0 +1,167 @@
+import heapq
+import json
+import logging
+import threading
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, List as ListType, Optional, Tuple
+from app.config import settings
+from app.models import Card, List
+
+logger = logging.getLogger(__name__)
+
+Sink = Callable[[Dict[str, Any]], None]
+
+
+def is_new_due_date(current: Optional[datetime], new: datetime) -> bool:
+    """Whether an update really moves a card's due date.
+
+    Clients send the due date with every save, so an unchanged one must not
+    re-arm a reminder that was already sent. Due dates are stored as naive UTC.
+    """
+    if new.tzinfo is not None:
+        new = new.astimezone(timezone.utc).replace(tzinfo=None)
+    return new != current
+
+
+def log_sink(notification: Dict[str, Any]) -> None:
+    logger.info("Card '%s' (ID: %s) is due at %s", notification["title"], notification["card_id"], notification["due_date"])
+
+
+def webhook_sink(notification: Dict[str, Any]) -> None:
+    request = urllib.request.Request(
+        settings.REMINDER_WEBHOOK_URL,
+        data=json.dumps(notification).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=10):
+        pass
+
+
+def create_sink() -> Sink:
+    """Create the notification sink configured by ``settings.REMINDER_SINK``."""
+    if settings.REMINDER_SINK == "log":
+        return log_sink
+    if settings.REMINDER_SINK == "webhook":
+        if not settings.REMINDER_WEBHOOK_URL:
+            raise ValueError("REMINDER_WEBHOOK_URL must be set for REMINDER_SINK=webhook")
+        return webhook_sink
+    raise ValueError(f"Unknown REMINDER_SINK: {settings.REMINDER_SINK}")
+
+
+class ReminderScheduler:
+    """Fires a notification when a card's due date (minus a lead time) is reached.
+
+    Only deadlines within the next ``horizon`` are kept in memory, in a heap
+    ordered by fire time and capped at ``max_pending`` entries. ``refresh``
+    reloads that window with an indexed range query on ``cards.due_date``;
+    ``schedule`` and ``cancel`` keep it current between refreshes. Each
+    reminder is claimed in the database before it is sent, so several worker
+    processes never notify twice.
+    """
+
+    def __init__(self, sink: Sink, lead: timedelta, horizon: timedelta, catch_up: timedelta, max_pending: int):
+        self.sink = sink
+        self.lead = lead
+        self.horizon = horizon
+        self.catch_up = catch_up
+        self.max_pending = max_pending
+        self.heap: ListType[Tuple[datetime, str]] = []
+        self.pending: Dict[str, datetime] = {}  # card_id -> due date of its valid heap entry
+        self.loaded_until = datetime.min
+        self.lock = threading.Lock()
+
+    def refresh(self, db: Session, now: Optional[datetime] = None) -> None:
+        """Reload all unsent reminders that fire before ``now + horizon``."""
+        now = now or datetime.utcnow()
+        until = now + self.horizon + self.lead
+        rows = db.query(Card.id, Card.due_date).filter(
+            Card.due_date >= now - self.catch_up,
+            Card.due_date < until,
+            Card.reminder_sent_at.is_(None),
+        ).order_by(Card.due_date).limit(self.max_pending).all()
+
+        with self.lock:
+            self.pending = {card_id: due_date for card_id, due_date in rows}
+            self.heap = [(due_date - self.lead, card_id) for card_id, due_date in rows]
+            heapq.heapify(self.heap)
+            # With a full window, later deadlines are left to the next refresh
+            self.loaded_until = rows[-1][1] if len(rows) == self.max_pending else until
+
+    def schedule(self, card_id: str, due_date: Optional[datetime]) -> None:
+        """Track a new or changed due date; ``None`` cancels the reminder."""
+        with self.lock:
+            self.pending.pop(card_id, None)
+            if due_date is None or due_date >= self.loaded_until or len(self.pending) >= self.max_pending:
+                return
+            self.pending[card_id] = due_date
+            heapq.heappush(self.heap, (due_date - self.lead, card_id))
+            self._compact()
+
+    def cancel(self, card_id: str) -> None:
+        self.schedule(card_id, None)
+
+    def _compact(self) -> None:
+        # Drop superseded heap entries once they outnumber the live ones
+        if len(self.heap) > 2 * len(self.pending) + 64:
+            self.heap = [(self.pending[card_id] - self.lead, card_id) for card_id in self.pending]
+            heapq.heapify(self.heap)
+
+    def pop_due(self, now: datetime) -> ListType[Tuple[str, datetime]]:
+        """Remove and return (card_id, due_date) of all reminders due by ``now``."""
+        due = []
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                fire_at, card_id = heapq.heappop(self.heap)
+                due_date = self.pending.get(card_id)
+                if due_date is not None and due_date - self.lead == fire_at:
+                    del self.pending[card_id]
+                    due.append((card_id, due_date))
+        return due
+
+    def fire_due(self, db: Session, now: Optional[datetime] = None) -> int:
+        """Claim and send all reminders that are due.
+
+        Returns:
+            Number of notifications sent
+        """
+        now = now or datetime.utcnow()
+        sent = 0
+        for card_id, due_date in self.pop_due(now):
+            # Only one process wins the claim; a changed due date voids it
+            claimed = db.query(Card).filter(
+                Card.id == card_id, Card.due_date == due_date, Card.reminder_sent_at.is_(None)
+            ).update({Card.reminder_sent_at: now}, synchronize_session=False)
+            db.commit()
+            if not claimed:
+                continue
+
+            card = db.query(Card.title, Card.list_id, List.board_id).join(List, List.id == Card.list_id).filter(
+                Card.id == card_id
+            ).first()
+            if card is None:
+                continue
+            try:
+                self.sink({
+                    "card_id": card_id,
+                    "title": card.title,
+                    "list_id": card.list_id,
+                    "board_id": card.board_id,
+                    "due_date": due_date.isoformat(),
+                })
+                sent += 1
+            except Exception:
+                logger.exception("Sending the reminder for card %s failed", card_id)
+        return sent
+
+
+# Global reminder scheduler instance
+reminder_scheduler = ReminderScheduler(
+    sink=create_sink(),
+    lead=timedelta(minutes=settings.REMINDER_LEAD_MINUTES),
+    horizon=timedelta(hours=settings.REMINDER_HORIZON_HOURS),
+    catch_up=timedelta(hours=settings.REMINDER_CATCH_UP_HOURS),
+    max_pending=settings.REMINDER_MAX_PENDING,
+)
@@ -0,0 +1,235 @@
+import re
+import threading
+import zlib
+from collections import OrderedDict
+import numpy as np
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List as ListType, Optional, Tuple
+from app.config import settings
+from app.models import Board, BoardChange, Card, List
+from app.services.change_log import board_version
+from app.services.profiling import deep_sizeof
+
+DIMENSIONS = 512  # Keeps a 1000-card board at 2 MB and a lookup well under a millisecond
+TITLE_WEIGHT = 2.0
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _features(text: str) -> Iterable[str]:
+    """Words plus character trigrams, so compounds and typos still overlap."""
+    words = TOKEN_PATTERN.findall(text.lower())
+    for word in words:
+        yield "w:" + word
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            yield padded[i:i + 3]
+
+
+def vectorize(texts: ListType[Tuple[str, Optional[str]]]) -> np.ndarray:
+    """Embed (title, description) pairs with a signed hashing vectoriser.
+
+    Returns:
+        Array of shape (len(texts), DIMENSIONS) with L2-normalised rows
+    """
+    rows, columns, values = [], [], []
+    for row, (title, description) in enumerate(texts):
+        for text, weight in ((title, TITLE_WEIGHT), (description or "", 1.0)):
+            for feature in _features(text):
+                # crc32 instead of hash(): stable across processes and restarts
+                hashed = zlib.crc32(feature.encode())
+                rows.append(row)
+                columns.append(hashed % DIMENSIONS)
+                values.append(weight if hashed & 0x80000000 else -weight)
+
+    vectors = np.zeros((len(texts), DIMENSIONS), dtype=np.float32)
+    np.add.at(vectors, (np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64)), values)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-9)
+
+
+class BoardIndex:
+    """Card vectors of one board in a preallocated matrix, one row per card."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        self.ids: ListType[str] = []
+        self.rows: Dict[str, int] = {}  # card_id -> row
+        self.cards: ListType[Dict[str, str]] = []  # id, title and list_id per row
+        self.vectors = np.zeros((16, DIMENSIONS), dtype=np.float32)
+        self.version: Optional[int] = None  # Last board change applied; None until built
+
+    def upsert(self, cards: ListType[Tuple[str, str, str, Optional[str]]]) -> None:
+        """Add or replace (card_id, list_id, title, description) rows."""
+        if not cards:
+            return
+        vectors = vectorize([(title, description) for _, _, title, description in cards])
+        needed = len(self.ids) + len(cards)
+        if needed > len(self.vectors):
+            grown = np.zeros((max(needed, 2 * len(self.vectors)), DIMENSIONS), dtype=np.float32)
+            grown[:len(self.ids)] = self.vectors[:len(self.ids)]
+            self.vectors = grown
+
+        for (card_id, list_id, title, _), vector in zip(cards, vectors):
+            row = self.rows.get(card_id)
+            if row is None:
+                row = self.rows[card_id] = len(self.ids)
+                self.ids.append(card_id)
+                self.cards.append({})
+            self.vectors[row] = vector
+            self.cards[row] = {"id": card_id, "title": title, "list_id": list_id}
+
+    def remove(self, card_id: str) -> None:
+        row = self.rows.pop(card_id, None)
+        if row is None:
+            return
+        # Move the last row into the gap
+        last = len(self.ids) - 1
+        if row != last:
+            self.ids[row] = self.ids[last]
+            self.cards[row] = self.cards[last]
+            self.vectors[row] = self.vectors[last]
+            self.rows[self.ids[row]] = row
+        self.ids.pop()
+        self.cards.pop()
+
+    def search(self, vector: np.ndarray, limit: int, min_score: float, exclude_id: Optional[str] = None):
+        count = len(self.ids)
+        if count == 0:
+            return []
+        scores = self.vectors[:count] @ vector
+        if exclude_id in self.rows:
+            scores[self.rows[exclude_id]] = -1.0
+        k = min(limit, count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            {**self.cards[row], "score": round(float(scores[row]), 4)}
+            for row in top if scores[row] >= min_score
+        ]
+
+
+class SimilarityIndex:
+    """In-memory vector index over card title and description, per board.
+
+    A board is indexed on its first lookup. Later lookups apply only the card
+    changes recorded in the board change log since then, so the index follows
+    writes from every worker process and the agent without extra hooks.
+    Indexes of the least recently used boards are evicted beyond ``max_boards``.
+    """
+
+    def __init__(self, max_boards: int):
+        self.max_boards = max_boards
+        self.boards: "OrderedDict[str, BoardIndex]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _board_index(self, board_id: str) -> BoardIndex:
+        with self.lock:
+            index = self.boards.get(board_id)
+            if index is None:
+                index = self.boards[board_id] = BoardIndex()
+                while len(self.boards) > self.max_boards:
+                    self.boards.popitem(last=False)
+            self.boards.move_to_end(board_id)
+            return index
+
+    def cache_sizes(self) -> Dict[str, int]:
+        """Approximate bytes held per indexed board."""
+        with self.lock:
+            boards = list(self.boards.items())
+        return {
+            board_id: index.vectors.nbytes + deep_sizeof((index.ids, index.rows, index.cards))
+            for board_id, index in boards
+        }
+
+    def _sync(self, db: Session, board_id: str, index: BoardIndex) -> bool:
+        """Bring a board's index up to date with its change log.
+
+        Returns:
+            False if the board does not exist
+        """
+        board = db.query(Board.changes_pruned_through).filter(Board.id == board_id).first()
+        if board is None:
+            with self.lock:
+                self.boards.pop(board_id, None)
+            return False
+        version = board_version(db, board_id)
+        if version == index.version:
+            return True
+
+        cards = db.query(Card.id, Card.list_id, Card.title, Card.description).join(
+            List, List.id == Card.list_id
+        ).filter(List.board_id == board_id)
+        if index.version is None or index.version < board.changes_pruned_through:
+            # First lookup, or the log no longer reaches back to our version
+            index.clear()
+            index.upsert([tuple(card) for card in cards])
+        else:
+            changed = {
+                id for id, in db.query(BoardChange.entity_id).filter(
+                    BoardChange.board_id == board_id,
+                    BoardChange.entity == "card",
+                    BoardChange.id > index.version,
+                    BoardChange.id <= version,
+                ).distinct()
+            }
+            current = [tuple(card) for card in cards.filter(Card.id.in_(changed))] if changed else []
+            index.upsert(current)
+            for card_id in changed - {card[0] for card in current}:
+                index.remove(card_id)
+        index.version = version
+        return True
+
+    def search(
+        self,
+        db: Session,
+        board_id: str,
+        text: str,
+        limit: int = 5,
+        min_score: float = 0.3,
+        exclude_id: Optional[str] = None
+    ) -> Optional[ListType[Dict[str, Any]]]:
+        """Find the cards of a board most similar to ``text``.
+
+        Args:
+            db: Database session
+            board_id: Board ID
+            text: Query, e.g. the title of a card about to be created
+            limit: Maximum number of results
+            min_score: Minimum cosine similarity (0 to 1)
+            exclude_id: Card to leave out, e.g. the card the query was taken from
+
+        Returns:
+            Cards with id, title, list_id and score, best first; None if the board does not exist
+        """
+        index = self._board_index(board_id)
+        with index.lock:
+            if not self._sync(db, board_id, index):
+                return None
+            return index.search(vectorize([(text, None)])[0], limit, min_score, exclude_id)
+
+    def similar_to_card(
+        self, db: Session, card_id: str, limit: int = 5, min_score: float = 0.3
+    ) -> Optional[ListType[Dict[str, Any]]]:
+        """Find the cards most similar to an existing card on the same board.
+
+        Returns:
+            Same as ``search``; None if the card does not exist
+        """
+        card = db.query(Card.title, Card.description, List.board_id).join(
+            List, List.id == Card.list_id
+        ).filter(Card.id == card_id).first()
+        if card is None:
+            return None
+        index = self._board_index(card.board_id)
+        with index.lock:
+            if not self._sync(db, card.board_id, index):
+                return None
+            vector = vectorize([(card.title, card.description)])[0]
+            return index.search(vector, limit, min_score, exclude_id=card_id)
+
+
+# Global similarity index instance
+similarity_index = SimilarityIndex(settings.SIMILARITY_MAX_BOARDS)
@@ -0,0 +1,270 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+import numpy as np
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List as ListType, Tuple
+from app.config import settings
+from app.models import ActivityEvent, Board, CardFlow, Card, List, ListDailyStat
+
+FLOW_ACTIONS = ("card.created", "card.moved", "card.deleted", "card.archived", "card.restored", "list.deleted")
+UPSERT_BATCH_SIZE = 500  # Rows per INSERT ... ON CONFLICT, well below bind parameter limits
+
+
+def _flow_records(events: Iterable[Dict[str, Any]]) -> Tuple[list, list]:
+    """Turn activity events into list flow and card move records.
+
+    Returns:
+        Tuple of (board_id, list_id, day, entered, exited) records and
+        (board_id, card_id, to_list_id, ts) move records
+    """
+    flows = []
+    moves = []
+    for event in events:
+        action = event["action"]
+        details = event["details"] or {}
+        board_id = event["board_id"]
+        day = event["ts"].date()
+        if action in ("card.created", "card.restored"):
+            flows.append((board_id, details["list_id"], day, 1, 0))
+        elif action in ("card.deleted", "card.archived"):
+            flows.append((board_id, details["list_id"], day, 0, 1))
+        elif action == "list.deleted":
+            flows.append((board_id, event["entity_id"], day, 0, details.get("card_count", 0)))
+        elif action == "card.moved":
+            moves.append((board_id, event["entity_id"], details["to_list_id"], event["ts"]))
+            if details["from_list_id"] != details["to_list_id"]:
+                # The event belongs to the target board; a move between boards exits the source board
+                flows.append((details.get("from_board_id", board_id), details["from_list_id"], day, 0, 1))
+                flows.append((board_id, details["to_list_id"], day, 1, 0))
+    return flows, moves
+
+
+def _done_list_ids(db: Session, list_ids: Iterable[str]) -> set:
+    list_ids = set(list_ids)
+    if not list_ids:
+        return set()
+    return {
+        id for id, in db.query(List.id).filter(
+            List.id.in_(list_ids), func.lower(List.title).in_(settings.done_list_titles)
+        )
+    }
+
+
+def _dialect_insert(db: Session):
+    """INSERT construct with ON CONFLICT support for the session's database."""
+    return postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+
+def apply_flow_events(db: Session, events: ListType[Dict[str, Any]]) -> None:
+    """Update daily list counters and card flow times from a batch of activity events.
+
+    Called by the activity log in the same transaction that writes the
+    events, so counters and events are never out of step.
+    """
+    flows, moves = _flow_records(event for event in events if event["action"] in FLOW_ACTIONS)
+    if not flows and not moves:
+        return
+
+    deltas: Dict[Tuple[str, date], list] = defaultdict(lambda: [None, 0, 0])
+    for board_id, list_id, day, entered, exited in flows:
+        delta = deltas[(list_id, day)]
+        delta[0] = board_id
+        delta[1] += entered
+        delta[2] += exited
+
+    # Increment in SQL, so concurrent flushes from several workers add up instead of overwriting each other
+    insert = _dialect_insert(db)
+    rows = [
+        {"list_id": list_id, "day": day, "board_id": board_id, "entered": entered, "exited": exited}
+        for (list_id, day), (board_id, entered, exited) in deltas.items()
+    ]
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        stmt = insert(ListDailyStat).values(rows[start:start + UPSERT_BATCH_SIZE])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["list_id", "day"],
+            set_={
+                "entered": ListDailyStat.entered + stmt.excluded.entered,
+                "exited": ListDailyStat.exited + stmt.excluded.exited,
+            },
+        ))
+
+    if moves:
+        # The first move ever starts a card's clock; a flow row that already exists keeps its start
+        first_moves = {}
+        for board_id, card_id, _, ts in moves:
+            first_moves.setdefault(card_id, {"card_id": card_id, "board_id": board_id, "first_moved_at": ts})
+        rows = list(first_moves.values())
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            db.execute(insert(CardFlow).values(rows[start:start + UPSERT_BATCH_SIZE]).on_conflict_do_nothing(
+                index_elements=["card_id"]
+            ))
+
+        done_lists = _done_list_ids(db, (to_list_id for _, _, to_list_id, _ in moves))
+        done_cards = {card_id for _, card_id, to_list_id, _ in moves if to_list_id in done_lists}
+        started = dict(
+            db.query(CardFlow.card_id, CardFlow.first_moved_at).filter(CardFlow.card_id.in_(done_cards))
+        ) if done_cards else {}
+        finished = set()
+        for _, card_id, to_list_id, ts in moves:
+            first_moved_at = started.get(card_id)
+            if (
+                to_list_id in done_lists and card_id not in finished
+                and first_moved_at is not None and ts > first_moved_at
+            ):
+                finished.add(card_id)
+                # Only the first arrival in "Done" counts, even if another worker got there first
+                db.query(CardFlow).filter(CardFlow.card_id == card_id, CardFlow.done_at.is_(None)).update(
+                    {
+                        CardFlow.done_at: ts,
+                        CardFlow.cycle_time_seconds: (ts - first_moved_at).total_seconds(),
+                    },
+                    synchronize_session=False,
+                )
+
+
+def recompute_board_stats(db: Session, board_id: str) -> None:
+    """Rebuild a board's counters from its raw activity events (backfill).
+
+    Aggregation runs on NumPy arrays. Cards that predate the retained events
+    are added as an opening balance on the first day, so current WIP always
+    matches the cards table.
+    """
+    events = [
+        {"board_id": event_board_id, "ts": ts, "action": action, "entity_id": entity_id, "details": details}
+        for event_board_id, ts, action, entity_id, details in db.query(
+            ActivityEvent.board_id, ActivityEvent.ts, ActivityEvent.action, ActivityEvent.entity_id,
+            ActivityEvent.details
+        ).filter(
+            ActivityEvent.action.in_(FLOW_ACTIONS),
+            or_(
+                ActivityEvent.board_id == board_id,
+                # Cards moved from this board to another one are logged on the target board
+                and_(
+                    ActivityEvent.action == "card.moved",
+                    ActivityEvent.details["from_board_id"].as_string() == board_id,
+                ),
+            ),
+        ).order_by(ActivityEvent.ts, ActivityEvent.id)
+    ]
+    flows, moves = _flow_records(events)
+    flows = [flow for flow in flows if flow[0] == board_id]
+    moves = [move for move in moves if move[0] == board_id]
+
+    current_counts = dict(
+        db.query(Card.list_id, func.count(Card.id)).join(List, List.id == Card.list_id).filter(
+            List.board_id == board_id
+        ).group_by(Card.list_id).all()
+    )
+
+    stats = []
+    list_ids = sorted({flow[1] for flow in flows} | set(current_counts))
+    if list_ids:
+        first_day = min((flow[2] for flow in flows), default=datetime.utcnow().date())
+        list_index = {list_id: i for i, list_id in enumerate(list_ids)}
+        list_codes = np.array([list_index[flow[1]] for flow in flows], dtype=np.int64)
+        day_codes = np.array([(flow[2] - first_day).days for flow in flows], dtype=np.int64)
+        n_days = int(day_codes.max()) + 1 if len(flows) else 1
+        keys = list_codes * n_days + day_codes
+        size = len(list_ids) * n_days
+        entered = np.bincount(keys, weights=[flow[3] for flow in flows], minlength=size).reshape(len(list_ids), n_days)
+        exited = np.bincount(keys, weights=[flow[4] for flow in flows], minlength=size).reshape(len(list_ids), n_days)
+
+        # Opening balance for cards that existed before the retained events
+        counts = np.array([current_counts.get(list_id, 0) for list_id in list_ids])
+        entered[:, 0] += np.maximum(counts - (entered.sum(axis=1) - exited.sum(axis=1)), 0)
+
+        for i, j in zip(*np.nonzero(entered + exited)):
+            stats.append(ListDailyStat(
+                board_id=board_id,
+                list_id=list_ids[i],
+                day=first_day + timedelta(days=int(j)),
+                entered=int(entered[i, j]),
+                exited=int(exited[i, j]),
+            ))
+
+    card_flows = []
+    if moves:
+        done_lists = _done_list_ids(db, (to_list_id for _, _, to_list_id, _ in moves))
+        card_ids, card_codes = np.unique([card_id for _, card_id, _, _ in moves], return_inverse=True)
+        times = np.array([ts for _, _, _, ts in moves], dtype="datetime64[us]")
+        is_done = np.array([to_list_id in done_lists for _, _, to_list_id, _ in moves])
+
+        never = np.datetime64("9999-12-31", "us")
+        first_moved = np.full(len(card_ids), never)
+        np.minimum.at(first_moved, card_codes, times)
+        # The first move starts the clock, so only later moves into "Done" finish it
+        finishing = is_done & (times > first_moved[card_codes])
+        done = np.full(len(card_ids), never)
+        np.minimum.at(done, card_codes[finishing], times[finishing])
+
+        has_done = done != never
+        cycle_seconds = (done - first_moved).astype("timedelta64[us]").astype(np.float64) / 1e6
+        for i, card_id in enumerate(card_ids):
+            card_flows.append(CardFlow(
+                card_id=str(card_id),
+                board_id=board_id,
+                first_moved_at=first_moved[i].astype(datetime),
+                done_at=done[i].astype(datetime) if has_done[i] else None,
+                cycle_time_seconds=float(cycle_seconds[i]) if has_done[i] else None,
+            ))
+
+    db.query(ListDailyStat).filter(ListDailyStat.board_id == board_id).delete(synchronize_session=False)
+    db.query(CardFlow).filter(CardFlow.board_id == board_id).delete(synchronize_session=False)
+    db.add_all(stats + card_flows)
+    db.query(Board).filter(Board.id == board_id).update(
+        {Board.stats_computed_at: datetime.utcnow()}, synchronize_session=False
+    )
+    db.commit()
+
+
+def board_stats(db: Session, board_id: str, days: int = 30) -> Dict[str, Any]:
+    """Serve flow metrics from the precomputed counters.
+
+    Returns:
+        Dict with per-list WIP, cumulative flow over the last ``days`` days and
+        cycle time percentiles in hours
+    """
+    lists = db.query(List.id, List.title).filter(List.board_id == board_id).order_by(List.order).all()
+    rows = db.query(ListDailyStat.list_id, ListDailyStat.day, ListDailyStat.entered, ListDailyStat.exited).filter(
+        ListDailyStat.board_id == board_id
+    ).all()
+
+    today = datetime.utcnow().date()
+    start = today - timedelta(days=days - 1)
+    list_index = {list_id: i for i, (list_id, _) in enumerate(lists)}
+    net = np.zeros((len(lists), days + 1), dtype=np.int64)  # Column 0 holds everything before the window
+    for list_id, day, entered, exited in rows:
+        i = list_index.get(list_id)
+        if i is not None:
+            net[i, min(max((day - start).days + 1, 0), days)] += entered - exited
+    flow = np.cumsum(net, axis=1)[:, 1:]
+
+    cycle_times = np.array([
+        seconds for seconds, in db.query(CardFlow.cycle_time_seconds).filter(
+            CardFlow.board_id == board_id, CardFlow.cycle_time_seconds.isnot(None)
+        )
+    ], dtype=np.float64) / 3600
+
+    return {
+        "lists": [
+            {"list_id": list_id, "title": title, "wip": int(flow[i, -1])}
+            for i, (list_id, title) in enumerate(lists)
+        ],
+        "cumulative_flow": {
+            "days": [(start + timedelta(days=d)).isoformat() for d in range(days)],
+            "lists": {list_id: flow[i].tolist() for i, (list_id, _) in enumerate(lists)},
+        },
+        "cycle_time_hours": {
+            "count": int(len(cycle_times)),
+            "average": float(cycle_times.mean()) if len(cycle_times) else None,
+            "median": float(np.median(cycle_times)) if len(cycle_times) else None,
+            "p85": float(np.percentile(cycle_times, 85)) if len(cycle_times) else None,
+        },
+    }
+
+
+def has_board_stats(db: Session, board_id: str) -> bool:
+    """Whether the board's counters exist, even if empty; new boards have them from the start."""
+    return db.query(Board.stats_computed_at).filter(Board.id == board_id).scalar() is not None
@@ -1,8 +1,19 @@
 from langchain_core.tools import tool
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from typing import Optional
 from datetime import datetime
 from app.models import Board, List as BoardList, Card
+from app.services import archive
+from app.services.activity import activity_log
+from app.services.change_log import record_change
+from app.services.reminders import is_new_due_date, reminder_scheduler
+from app.services.similarity import similarity_index
+
+CONFLICT_MESSAGE = (
+    "Fehler: {what} wurde gleichzeitig von jemand anderem geändert. "
+    "Nutze get_board_info() für den aktuellen Stand und versuche es erneut."
+)
 
 
 def create_board_tools(db: Session, board_id: str):
@@ -64,8 +75,13 @@ def create_board_tools(db: Session, board_id: str):
                 due_date=parsed_date
             )
             db.add(card)
+            db.flush()
+            record_change(db, lst.board_id, "card", card.id)
             db.commit()
+            activity_log.emit(lst.board_id, "agent", "card.created", card.id, list_id=list_id, title=title)
             db.refresh(card)
+            if card.due_date is not None:
+                reminder_scheduler.schedule(card.id, card.due_date)
 
             return f"Erfolgreich Karte '{title}' (ID: {card.id}) in Liste '{lst.title}' erstellt"
         except Exception as e:
@@ -100,14 +116,30 @@ def create_board_tools(db: Session, board_id: str):
                 card.description = description
             if labels is not None:
                 card.labels = [label.strip() for label in labels.split(",")]
+            due_date_moved = False
             if due_date is not None:
                 try:
-                    card.due_date = datetime.strptime(due_date, "%Y-%m-%d")
+                    new_due_date = datetime.strptime(due_date, "%Y-%m-%d")
                 except ValueError:
                     return f"Fehler: Ungültiges Datumsformat. Nutze YYYY-MM-DD"
+                due_date_moved = is_new_due_date(card.due_date, new_due_date)
+                if due_date_moved:
+                    card.due_date = new_due_date
+                    card.reminder_sent_at = None
 
+            record_change(db, card.list.board_id, "card", card.id)
             db.commit()
+            changed = {"title": title, "description": description, "labels": labels, "due_date": due_date}
+            activity_log.emit(
+                card.list.board_id, "agent", "card.updated", card.id,
+                fields=sorted(field for field, value in changed.items() if value is not None)
+            )
+            if due_date_moved:
+                reminder_scheduler.schedule(card.id, card.due_date)
             return f"Erfolgreich Karte '{card.title}' (ID: {card_id}) aktualisiert"
+        except StaleDataError:
+            db.rollback()
+            return CONFLICT_MESSAGE.format(what=f"Karte mit ID {card_id}")
         except Exception as e:
             db.rollback()
             return f"Fehler beim Aktualisieren der Karte: {str(e)}"
@@ -125,9 +157,16 @@ def create_board_tools(db: Session, board_id: str):
                 return f"Fehler: Karte mit ID {card_id} nicht gefunden"
 
             title = card.title
+            card_board_id, list_id = card.list.board_id, card.list_id
+            record_change(db, card_board_id, "card", card.id, "delete")
             db.delete(card)
             db.commit()
+            activity_log.emit(card_board_id, "agent", "card.deleted", card_id, list_id=list_id, title=title)
+            reminder_scheduler.cancel(card_id)
             return f"Erfolgreich Karte '{title}' gelöscht"
+        except StaleDataError:
+            db.rollback()
+            return CONFLICT_MESSAGE.format(what=f"Karte mit ID {card_id}")
         except Exception as e:
             db.rollback()
             return f"Fehler beim Löschen der Karte: {str(e)}"
@@ -151,6 +190,11 @@ def create_board_tools(db: Session, board_id: str):
                 return f"Fehler: Liste mit ID {target_list_id} nicht gefunden"
 
             old_list_title = card.list.title
+            old_list_id, old_board_id = card.list_id, card.list.board_id
+            if card.list.board_id != target_list.board_id:
+                record_change(db, card.list.board_id, "card", card.id, "delete")
+            if card.list_id != target_list_id:
+                card.list_entered_at = datetime.utcnow()
             card.list_id = target_list_id
 
             if order is not None:
@@ -160,8 +204,16 @@ def create_board_tools(db: Session, board_id: str):
                 max_order = db.query(Card).filter(Card.list_id == target_list_id).count()
                 card.order = max_order
 
+            record_change(db, target_list.board_id, "card", card.id)
             db.commit()
+            activity_log.emit(
+                target_list.board_id, "agent", "card.moved", card.id, from_board_id=old_board_id,
+                from_list_id=old_list_id, to_list_id=target_list_id, title=card.title
+            )
             return f"Erfolgreich Karte '{card.title}' von '{old_list_title}' nach '{target_list.title}' verschoben"
+        except StaleDataError:
+            db.rollback()
+            return CONFLICT_MESSAGE.format(what=f"Karte mit ID {card_id}")
         except Exception as e:
             db.rollback()
             return f"Fehler beim Verschieben der Karte: {str(e)}"
@@ -185,7 +237,10 @@ def create_board_tools(db: Session, board_id: str):
                 order=order
             )
             db.add(new_list)
+            db.flush()
+            record_change(db, board_id, "list", new_list.id)
             db.commit()
+            activity_log.emit(board_id, "agent", "list.created", new_list.id, title=title)
             db.refresh(new_list)
 
             return f"Erfolgreich Liste '{title}' (ID: {new_list.id}) erstellt"
@@ -212,8 +267,17 @@ def create_board_tools(db: Session, board_id: str):
             if order is not None:
                 lst.order = order
 
+            record_change(db, lst.board_id, "list", lst.id)
             db.commit()
+            changed = {"title": title, "order": order}
+            activity_log.emit(
+                lst.board_id, "agent", "list.updated", lst.id,
+                fields=sorted(field for field, value in changed.items() if value is not None)
+            )
             return f"Erfolgreich Liste (ID: {list_id}) aktualisiert"
+        except StaleDataError:
+            db.rollback()
+            return CONFLICT_MESSAGE.format(what=f"Liste mit ID {list_id}")
         except Exception as e:
             db.rollback()
             return f"Fehler beim Aktualisieren der Liste: {str(e)}"
@@ -232,19 +296,112 @@ def create_board_tools(db: Session, board_id: str):
 
             title = lst.title
             card_count = len(lst.cards)
+            for card in lst.cards:
+                record_change(db, lst.board_id, "card", card.id, "delete")
+            record_change(db, lst.board_id, "list", lst.id, "delete")
+            list_board_id = lst.board_id
             db.delete(lst)
             db.commit()
+            activity_log.emit(list_board_id, "agent", "list.deleted", list_id, title=title, card_count=card_count)
             return f"Erfolgreich Liste '{title}' und {card_count} Karte(n) gelöscht"
+        except StaleDataError:
+            db.rollback()
+            return CONFLICT_MESSAGE.format(what=f"Liste mit ID {list_id}")
         except Exception as e:
             db.rollback()
             return f"Fehler beim Löschen der Liste: {str(e)}"
 
+    @tool
+    def archive_card(card_id: str) -> str:
+        """Archiviere eine erledigte Karte. Sie verschwindet vom Board, bleibt aber im Archiv auffindbar.
+
+        Args:
+            card_id: Die ID der zu archivierenden Karte
+        """
+        try:
+            archived = archive.archive_card(db, card_id, "agent")
+            if archived is None:
+                return f"Fehler: Karte mit ID {card_id} nicht gefunden"
+            return f"Erfolgreich Karte '{archived['title']}' (ID: {card_id}) archiviert"
+        except Exception as e:
+            db.rollback()
+            return f"Fehler beim Archivieren der Karte: {str(e)}"
+
+    @tool
+    def search_archive(query: str) -> str:
+        """Durchsuche die archivierten Karten des Boards nach Titel und Beschreibung.
+
+        Args:
+            query: Suchbegriff
+        """
+        cards, next_cursor = archive.search_archive(db, board_id, query, limit=20)
+        if not cards:
+            return f"Keine archivierten Karten zu '{query}' gefunden"
+        result = f"Archivierte Karten zu '{query}':\n"
+        for card in cards:
+            result += (
+                f"  - Karte: {card['title']} (ID: {card['id']}), aus Liste '{card['list_title']}', "
+                f"archiviert am {card['archived_at'].strftime('%Y-%m-%d')}\n"
+            )
+        if next_cursor:
+            result += "  (Weitere Treffer vorhanden, verfeinere den Suchbegriff)\n"
+        return result
+
+    @tool
+    def restore_card(card_id: str, list_id: Optional[str] = None) -> str:
+        """Hole eine archivierte Karte zurück auf das Board.
+
+        Args:
+            card_id: Die ID der archivierten Karte
+            list_id: Optionale Ziel-Liste (Standard: ursprüngliche Liste)
+        """
+        try:
+            card = archive.restore_card(db, card_id, list_id, "agent")
+            if card is None:
+                return f"Fehler: Archivierte Karte mit ID {card_id} nicht gefunden"
+            return f"Erfolgreich Karte '{card.title}' (ID: {card_id}) in Liste '{card.list.title}' wiederhergestellt"
+        except ValueError:
+            return f"Fehler: Liste mit ID {list_id} nicht gefunden"
+        except Exception as e:
+            db.rollback()
+            return f"Fehler beim Wiederherstellen der Karte: {str(e)}"
+
+    @tool
+    def find_similar_cards(text: str) -> str:
+        """Finde Karten mit ähnlichem Titel oder ähnlicher Beschreibung, ohne das ganze Board zu laden.
+        Nutze das vor create_card(), um Duplikate zu vermeiden, und um Karten nach ihrer Bedeutung zu finden.
+
+        Args:
+            text: Titel oder Stichworte der gesuchten Karte
+        """
+        cards = similarity_index.search(db, board_id, text)
+        if not cards:
+            return f"Keine ähnlichen Karten zu '{text}' gefunden"
+        lists = dict(db.query(BoardList.id, BoardList.title).filter(BoardList.board_id == board_id).all())
+        result = f"Ähnliche Karten zu '{text}':\n"
+        for card in cards:
+            result += (
+                f"  - Karte: {card['title']} (ID: {card['id']}) in Liste '{lists.get(card['list_id'], '?')}', "
+                f"Ähnlichkeit {card['score']:.2f}\n"
+            )
+        return result
+
     @tool
     def get_board_info() -> str:
         """Hole aktuelle Board-Informationen mit allen Listen und Karten."""
         from app.services.agent import get_board_context
         return get_board_context(db, board_id)
 
+    @tool
+    def get_board_changes(since_version: int) -> str:
+        """Hole nur die Änderungen am Board seit einer Version (günstiger als get_board_info).
+
+        Args:
+            since_version: Die Version aus der letzten get_board_info()- oder get_board_changes()-Ausgabe
+        """
+        from app.services.agent import format_board_changes
+        return format_board_changes(db, board_id, since_version)
+
     return [
         create_card,
         update_card,
@@ -253,5 +410,10 @@ def create_board_tools(db: Session, board_id: str):
         create_list,
         update_list,
         delete_list,
-        get_board_info
+        archive_card,
+        search_archive,
+        restore_card,
+        find_similar_cards,
+        get_board_info,
+        get_board_changes
     ]
@@ -0,0 +1,64 @@
+"""CPU per GET /boards/{id} request: ORM + Pydantic + stdlib JSON vs. row dicts + orjson.
+
+    python -m benchmarks.board_serialization --cards 1000 10000
+"""
+import argparse
+import json
+import time
+from benchmarks.common import use_temp_database, seed_large_board
+
+
+def cpu_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        samples.append((time.process_time() - start) * 1000)
+    return min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    use_temp_database()
+    import orjson
+    from fastapi.encoders import jsonable_encoder
+    from app.database import Base, engine
+    from app.database.session import SessionLocal
+    from app.models import Board
+    from app.schemas import Board as BoardSchema
+    from app.services.board_payload import board_payloads
+
+    Base.metadata.create_all(bind=engine)
+
+    print(f"{'cards':>6}  {'orm+pydantic ms':>15}  {'rows+orjson ms':>14}  {'speedup':>7}  {'bytes':>9}")
+    for card_count in args.cards:
+        db = SessionLocal()
+        board_id = seed_large_board(db, card_count)
+        db.close()
+
+        def legacy():
+            db = SessionLocal()
+            board = db.query(Board).filter(Board.id == board_id).first()
+            body = json.dumps(jsonable_encoder(BoardSchema.model_validate(board))).encode()
+            db.close()
+            return body
+
+        def fast():
+            db = SessionLocal()
+            body = orjson.dumps(board_payloads(db, board_id)[0])
+            db.close()
+            return body
+
+        assert json.loads(legacy()) == json.loads(fast()), "payloads differ"
+
+        legacy_ms = cpu_ms(legacy, args.repeat)
+        fast_ms = cpu_ms(fast, args.repeat)
+        print(f"{card_count:>6}  {legacy_ms:>15.1f}  {fast_ms:>14.1f}  {legacy_ms / fast_ms:>6.1f}x  {len(fast()):>9}")
+
+
+if __name__ == "__main__":
+    main()
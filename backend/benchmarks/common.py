@@ -0,0 +1,48 @@
+"""Shared helpers for the benchmark scripts.
+
+Run benchmarks from the backend directory, e.g.
+``python -m benchmarks.board_serialization``.
+"""
+import os
+import tempfile
+
+
+def use_temp_database() -> str:
+    """Point DATABASE_URL at a fresh SQLite file unless one is configured.
+
+    Must be called before anything from ``app`` is imported.
+    """
+    if "BENCH_DATABASE_URL" in os.environ:
+        url = os.environ["BENCH_DATABASE_URL"]
+    else:
+        workdir = tempfile.mkdtemp(prefix="kanban-bench-")
+        url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["DATABASE_URL"] = url
+    os.environ.setdefault("LLM_PROVIDER", "gemini")
+    return url
+
+
+def seed_large_board(db, card_count: int, list_count: int = 5) -> str:
+    """Create a board with ``card_count`` cards spread over ``list_count`` lists."""
+    from app.models import Board, List, Card
+
+    board = Board(title=f"Benchmark {card_count}")
+    db.add(board)
+    db.flush()
+
+    lists = [List(board_id=board.id, title=f"List {i}", order=i) for i in range(list_count)]
+    db.add_all(lists)
+    db.flush()
+
+    db.add_all([
+        Card(
+            list_id=lists[i % list_count].id,
+            title=f"Card {i}",
+            description="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 3,
+            order=i // list_count,
+            labels=["bug", "frontend"] if i % 3 == 0 else None,
+        )
+        for i in range(card_count)
+    ])
+    db.commit()
+    return board.id
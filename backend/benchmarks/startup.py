@@ -0,0 +1,56 @@
+"""Import time of app.main, startup (lifespan) time and first chat-service creation.
+
+Each sample runs in a fresh interpreter, like a new worker or a reload restart:
+
+    python -m benchmarks.startup --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from benchmarks.common import use_temp_database
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app):
+    started = time.perf_counter()
+langchain_loaded = any(name.startswith("langchain") for name in sys.modules)
+from app.services.chat import get_chat_service
+chat_start = time.perf_counter()
+get_chat_service()
+chat_ready = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": (started - imported) * 1000,
+    "first_chat_ms": (chat_ready - chat_start) * 1000,
+    "langchain_at_startup": langchain_loaded,
+}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    use_temp_database()
+    env = dict(os.environ, GEMINI_API_KEY=os.environ.get("GEMINI_API_KEY") or "benchmark")
+    samples = []
+    for _ in range(args.repeat):
+        result = subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True)
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    for key in ("import_ms", "startup_ms", "first_chat_ms"):
+        values = [sample[key] for sample in samples]
+        print(f"{key:>14}: median {statistics.median(values):8.1f} ms  (min {min(values):.1f}, max {max(values):.1f})")
+    print(f"LangChain imported before first chat request: {samples[0]['langchain_at_startup']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Gunicorn settings for running the API with uvicorn workers.
+
+Gunicorn additionally restarts crashed workers (pip install gunicorn):
+
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
+from app.config import settings
+
+bind = f"{settings.SERVER_HOST}:{settings.SERVER_PORT}"
+workers = settings.worker_count
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = settings.KEEP_ALIVE_TIMEOUT
+graceful_timeout = settings.GRACEFUL_SHUTDOWN_TIMEOUT
+timeout = 120  # Chat requests wait on the LLM
+
+
+def on_starting(server):
+    # Create tables once in the master instead of racing in every worker
+    if settings.DB_CREATE_TABLES:
+        from app.database import engine, create_tables
+
+        create_tables(engine)
+        engine.dispose()
+
+
+def post_fork(server, worker):
+    # Workers are forked with the master's already loaded settings (so they
+    # also size their pools for the same worker count); environment variables
+    # set here would not reach them
+    settings.DB_CREATE_TABLES = False
@@ -0,0 +1,94 @@
+"""Replay a recorded chat conversation offline against a seeded SQLite board.
+
+Record conversations by setting LLM_RECORD_DIR, then:
+
+    python replay.py recordings/<board_id>.json --repeat 20
+
+Every run seeds a fresh SQLite database from the board snapshot in the
+recording, plays the recorded LLM responses back through the real agent,
+tools and database, and checks each tool output against the recording.
+The reported latency is the chat overhead without any LLM round trips.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", help="Recording file written via LLM_RECORD_DIR")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of replay runs")
+    parser.add_argument("--verbose", action="store_true", help="Show agent output")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="kanban-replay-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'replay.db')}"
+    os.environ["LLM_PROVIDER"] = "replay"
+    os.environ["LLM_REPLAY_FILE"] = args.recording
+    os.environ["LLM_RECORD_DIR"] = ""
+
+    from app.database import Base, engine
+    from app.database.session import SessionLocal
+    from app.services.chat import get_chat_service
+    from app.services.recording import ID_PATTERN, ReplayChecker, seed_board
+
+    with open(args.recording, encoding="utf-8") as f:
+        recording = json.load(f)
+
+    board_id = recording["board"]["id"]
+    chat_service = get_chat_service()
+    llm = chat_service.llm
+    latencies = [[] for _ in recording["turns"]]
+    failures = 0
+
+    for run in range(args.repeat):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        llm.cursor = 0
+        llm.id_map.clear()
+
+        db = SessionLocal()
+        try:
+            chat_service.clear_history(db, board_id)
+            seed_board(db, recording["board"])
+            for index, turn in enumerate(recording["turns"]):
+                checker = ReplayChecker([call["output"] for call in turn["tool_calls"]], llm.id_map)
+                output = io.StringIO()
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(sys.stdout if args.verbose else output):
+                    result = chat_service.send_message(db, board_id, turn["input"], callbacks=[checker])
+                latencies[index].append((time.perf_counter() - start) * 1000)
+
+                expected = ID_PATTERN.sub(lambda m: f"ID: {llm.id_map.get(m.group(1), m.group(1))}", turn["output"])
+                if result["response"] != expected:
+                    checker.mismatches.append({"expected": expected, "actual": result["response"]})
+                if len(checker.mismatches) or checker.index != len(turn["tool_calls"]):
+                    failures += 1
+                    print(f"Run {run + 1}, turn {index + 1}: replay diverged from recording")
+                    for mismatch in checker.mismatches:
+                        print(f"  expected: {mismatch['expected']}")
+                        print(f"  actual:   {mismatch['actual']}")
+        finally:
+            db.close()
+
+    print(f"{'turn':>4}  {'tools':>5}  {'min ms':>8}  {'median ms':>9}  {'max ms':>8}  input")
+    for index, turn in enumerate(recording["turns"]):
+        samples = latencies[index]
+        print(
+            f"{index + 1:>4}  {len(turn['tool_calls']):>5}  {min(samples):>8.2f}  "
+            f"{statistics.median(samples):>9.2f}  {max(samples):>8.2f}  {turn['input'][:40]}"
+        )
+    total = [sum(run) for run in zip(*latencies)]
+    print(f"Total per run: median {statistics.median(total):.2f} ms over {args.repeat} run(s), {failures} failure(s)")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
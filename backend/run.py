@@ -1,6 +1,9 @@
+import os
 import uvicorn
 
 if __name__ == "__main__":
+    # Single development process; see serve.py for the multi-worker setup
+    os.environ.setdefault("WORKERS", "1")
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
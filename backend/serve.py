@@ -0,0 +1,35 @@
+"""Production server: multiple uvicorn workers with uvloop/httptools and no reload.
+
+Configured through the SERVER_*, WORKERS, KEEP_ALIVE_TIMEOUT,
+GRACEFUL_SHUTDOWN_TIMEOUT and DB_* settings. Use run.py for development.
+"""
+import os
+import sys
+import uvicorn
+from app.config import settings
+from app.database import engine, create_tables
+
+if __name__ == "__main__":
+    workers = settings.worker_count
+
+    # Create tables once here instead of racing in every worker's lifespan
+    if settings.DB_CREATE_TABLES:
+        create_tables(engine)
+    engine.dispose()
+
+    # Workers inherit these and size their connection pools accordingly
+    os.environ["WORKERS"] = str(workers)
+    os.environ["DB_CREATE_TABLES"] = "false"
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        timeout_keep_alive=settings.KEEP_ALIVE_TIMEOUT,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_TIMEOUT,
+        proxy_headers=True,
+        log_level="info"
+    )
@@ -44,9 +44,9 @@ export default function Card({ card, onClick }: CardProps) {
         </button>
         <div className="flex-1 min-w-0">
           <h3 className="font-medium text-foreground mb-1">{card.title}</h3>
-          {card.description && (
+          {(card.description ?? card.description_preview) && (
             <p className="text-sm text-muted-foreground line-clamp-2 mb-2">
-              {card.description}
+              {card.description ?? card.description_preview}
             </p>
           )}
           <div className="flex items-center gap-2 flex-wrap">
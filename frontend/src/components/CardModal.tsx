@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { X, Tag, Calendar, Trash2 } from 'lucide-react';
 import type { Card } from '../types';
+import { cardsApi } from '../services/api';
 
 interface CardModalProps {
   card: Card;
@@ -12,12 +13,24 @@ interface CardModalProps {
 export default function CardModal({ card, onClose, onSave, onDelete }: CardModalProps) {
   const [title, setTitle] = useState(card.title);
   const [description, setDescription] = useState(card.description || '');
+  // Board payloads only carry a description preview; load the full card on open
+  const [detailsLoaded, setDetailsLoaded] = useState(card.description !== undefined);
   const [labels, setLabels] = useState<string[]>(card.labels || []);
   const [newLabel, setNewLabel] = useState('');
   const [dueDate, setDueDate] = useState(
     card.due_date ? new Date(card.due_date).toISOString().split('T')[0] : ''
   );
 
+  useEffect(() => {
+    if (detailsLoaded) return;
+    cardsApi.getById(card.id)
+      .then((details) => {
+        setDescription(details.description || '');
+        setDetailsLoaded(true);
+      })
+      .catch((error) => console.error('Failed to load card details:', error));
+  }, [card.id]);
+
   useEffect(() => {
     const handleEscape = (e: KeyboardEvent) => {
       if (e.key === 'Escape') onClose();
@@ -30,7 +43,8 @@ export default function CardModal({ card, onClose, onSave, onDelete }: CardModal
     onSave({
       ...card,
       title,
-      description,
+      // Leave the description untouched if it never finished loading
+      description: detailsLoaded ? description : card.description,
       labels,
       due_date: dueDate ? new Date(dueDate).toISOString() : undefined,
     });
@@ -90,6 +104,7 @@ export default function CardModal({ card, onClose, onSave, onDelete }: CardModal
             <textarea
               value={description}
               onChange={(e) => setDescription(e.target.value)}
+              disabled={!detailsLoaded}
               className="w-full px-3 py-2 bg-background border border-border rounded-lg text-foreground placeholder:text-muted-foreground focus:outline-none focus:ring-2 focus:ring-primary min-h-[120px] resize-y"
               placeholder="Add a more detailed description..."
             />
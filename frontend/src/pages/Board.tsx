@@ -16,7 +16,7 @@ import List from '../components/List';
 import Card from '../components/Card';
 import CardModal from '../components/CardModal';
 import ChatBot from '../components/ChatBot';
-import { boardsApi, listsApi, cardsApi, type Board as BoardType, type Card as CardType, type List as ListType } from '../services/api';
+import { BOARD_VIEW_CARD_FIELDS, boardsApi, listsApi, cardsApi, type Board as BoardType, type Card as CardType, type List as ListType } from '../services/api';
 
 interface BoardProps {
   boardId: string;
@@ -52,7 +52,7 @@ export default function Board({ boardId, onBoardUpdate }: BoardProps) {
   const loadBoard = async () => {
     try {
       setLoading(true);
-      const data = await boardsApi.getById(boardId);
+      const data = await boardsApi.getById(boardId, BOARD_VIEW_CARD_FIELDS);
       setBoard(data);
       setBoardTitle(data.title);
     } catch (error) {
@@ -195,9 +195,14 @@ export default function Board({ boardId, onBoardUpdate }: BoardProps) {
       try {
         // Update all lists with their current order to keep them in sync
         const updatePromises = board.lists.map((list, index) =>
-          listsApi.update(list.id, { order: index })
+          listsApi.update(list.id, { order: index }, list.version)
         );
-        await Promise.all(updatePromises);
+        const updatedLists = await Promise.all(updatePromises);
+        const versions = new Map(updatedLists.map((l): [string, number] => [l.id, l.version]));
+        setBoard((current) => current && {
+          ...current,
+          lists: current.lists.map((l) => ({ ...l, version: versions.get(l.id) ?? l.version })),
+        });
       } catch (error) {
         console.error('Failed to update list positions:', error);
         loadBoard();
@@ -219,9 +224,17 @@ export default function Board({ boardId, onBoardUpdate }: BoardProps) {
             cardsApi.update(c.id, {
               list_id: c.listId,
               order: index,
-            })
+            }, c.version)
           );
-          await Promise.all(updatePromises);
+          const updatedCards = await Promise.all(updatePromises);
+          const versions = new Map(updatedCards.map((c): [string, number] => [c.id, c.version]));
+          setBoard((current) => current && {
+            ...current,
+            lists: current.lists.map((l) => ({
+              ...l,
+              cards: l.cards.map((c) => ({ ...c, version: versions.get(c.id) ?? c.version })),
+            })),
+          });
         } catch (error) {
           console.error('Failed to update card positions:', error);
           loadBoard();
@@ -265,12 +278,12 @@ export default function Board({ boardId, onBoardUpdate }: BoardProps) {
 
   const handleSaveCard = async (updatedCard: CardType) => {
     try {
-      await cardsApi.update(updatedCard.id, {
+      const saved = await cardsApi.update(updatedCard.id, {
         title: updatedCard.title,
         description: updatedCard.description,
         labels: updatedCard.labels,
         due_date: updatedCard.due_date,
-      });
+      }, updatedCard.version);
 
       if (board) {
         setBoard({
@@ -278,13 +291,15 @@ export default function Board({ boardId, onBoardUpdate }: BoardProps) {
           lists: board.lists.map((list) => ({
             ...list,
             cards: list.cards.map((card) =>
-              card.id === updatedCard.id ? updatedCard : card
+              card.id === updatedCard.id ? { ...updatedCard, version: saved.version } : card
             ),
           })),
         });
       }
     } catch (error) {
+      // Most likely a version conflict: reload to show the current state
       console.error('Failed to update card:', error);
+      loadBoard();
     }
   };
 
@@ -308,13 +323,14 @@ export default function Board({ boardId, onBoardUpdate }: BoardProps) {
 
   const handleUpdateListTitle = async (listId: string, title: string) => {
     try {
-      await listsApi.update(listId, { title });
+      const current = board?.lists.find((list) => list.id === listId);
+      const saved = await listsApi.update(listId, { title }, current?.version);
 
       if (board) {
         setBoard({
           ...board,
           lists: board.lists.map((list) =>
-            list.id === listId ? { ...list, title } : list
+            list.id === listId ? { ...list, title, version: saved.version } : list
           ),
         });
       }
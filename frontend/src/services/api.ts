@@ -1,14 +1,25 @@
 const API_BASE_URL = 'http://localhost:8080/api';
 
+// Include cookies so the backend can route reads to the primary right after our own writes
+const apiFetch = (input: string, init?: RequestInit) => fetch(input, { ...init, credentials: 'include' });
+
+// Send the known version as If-Match so the server rejects concurrent edits with 409
+const jsonHeaders = (version?: number): HeadersInit =>
+  version === undefined
+    ? { 'Content-Type': 'application/json' }
+    : { 'Content-Type': 'application/json', 'If-Match': `"${version}"` };
+
 export interface Card {
   id: string;
   title: string;
   description?: string;
+  description_preview?: string;  // First characters of the description in slim board payloads
   listId: string;
   order: number;
   labels?: string[];
   due_date?: string;
   created_at: string;
+  version: number;
 }
 
 export interface List {
@@ -18,6 +29,7 @@ export interface List {
   order: number;
   cards: Card[];
   created_at: string;
+  version: number;
 }
 
 export interface Board {
@@ -27,25 +39,29 @@ export interface Board {
   created_at: string;
 }
 
+// Card fields for the board view: descriptions are only previewed and loaded per card when opened
+export const BOARD_VIEW_CARD_FIELDS = ['title', 'description_preview', 'labels', 'due_date', 'created_at'];
+
 // Board API
 export const boardsApi = {
   // Get all boards
   getAll: async (): Promise<Board[]> => {
-    const response = await fetch(`${API_BASE_URL}/boards`);
+    const response = await apiFetch(`${API_BASE_URL}/boards`);
     if (!response.ok) throw new Error('Failed to fetch boards');
     return response.json();
   },
 
-  // Get single board with lists and cards
-  getById: async (boardId: string): Promise<Board> => {
-    const response = await fetch(`${API_BASE_URL}/boards/${boardId}`);
+  // Get single board with lists and cards, optionally only the given card fields
+  getById: async (boardId: string, cardFields?: string[]): Promise<Board> => {
+    const query = cardFields ? `?fields=${cardFields.join(',')}` : '';
+    const response = await apiFetch(`${API_BASE_URL}/boards/${boardId}${query}`);
     if (!response.ok) throw new Error('Failed to fetch board');
     return response.json();
   },
 
   // Create new board
   create: async (title: string): Promise<Board> => {
-    const response = await fetch(`${API_BASE_URL}/boards`, {
+    const response = await apiFetch(`${API_BASE_URL}/boards`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ title }),
@@ -56,7 +72,7 @@ export const boardsApi = {
 
   // Update board
   update: async (boardId: string, title: string): Promise<Board> => {
-    const response = await fetch(`${API_BASE_URL}/boards/${boardId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/boards/${boardId}`, {
       method: 'PUT',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ title }),
@@ -67,7 +83,7 @@ export const boardsApi = {
 
   // Delete board
   delete: async (boardId: string): Promise<void> => {
-    const response = await fetch(`${API_BASE_URL}/boards/${boardId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/boards/${boardId}`, {
       method: 'DELETE',
     });
     if (!response.ok) throw new Error('Failed to delete board');
@@ -78,7 +94,7 @@ export const boardsApi = {
 export const listsApi = {
   // Create new list
   create: async (boardId: string, title: string, order: number): Promise<List> => {
-    const response = await fetch(`${API_BASE_URL}/lists`, {
+    const response = await apiFetch(`${API_BASE_URL}/lists`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ board_id: boardId, title, order }),
@@ -88,10 +104,10 @@ export const listsApi = {
   },
 
   // Update list
-  update: async (listId: string, data: { title?: string; order?: number }): Promise<List> => {
-    const response = await fetch(`${API_BASE_URL}/lists/${listId}`, {
+  update: async (listId: string, data: { title?: string; order?: number }, version?: number): Promise<List> => {
+    const response = await apiFetch(`${API_BASE_URL}/lists/${listId}`, {
       method: 'PUT',
-      headers: { 'Content-Type': 'application/json' },
+      headers: jsonHeaders(version),
       body: JSON.stringify(data),
     });
     if (!response.ok) throw new Error('Failed to update list');
@@ -100,7 +116,7 @@ export const listsApi = {
 
   // Delete list
   delete: async (listId: string): Promise<void> => {
-    const response = await fetch(`${API_BASE_URL}/lists/${listId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/lists/${listId}`, {
       method: 'DELETE',
     });
     if (!response.ok) throw new Error('Failed to delete list');
@@ -109,6 +125,13 @@ export const listsApi = {
 
 // Card API
 export const cardsApi = {
+  // Get a single card with all details
+  getById: async (cardId: string): Promise<Card> => {
+    const response = await apiFetch(`${API_BASE_URL}/cards/${cardId}`);
+    if (!response.ok) throw new Error('Failed to fetch card');
+    return response.json();
+  },
+
   // Create new card
   create: async (data: {
     list_id: string;
@@ -118,7 +141,7 @@ export const cardsApi = {
     labels?: string[];
     due_date?: string;
   }): Promise<Card> => {
-    const response = await fetch(`${API_BASE_URL}/cards`, {
+    const response = await apiFetch(`${API_BASE_URL}/cards`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(data),
@@ -135,10 +158,10 @@ export const cardsApi = {
     due_date?: string;
     list_id?: string;
     order?: number;
-  }): Promise<Card> => {
-    const response = await fetch(`${API_BASE_URL}/cards/${cardId}`, {
+  }, version?: number): Promise<Card> => {
+    const response = await apiFetch(`${API_BASE_URL}/cards/${cardId}`, {
       method: 'PUT',
-      headers: { 'Content-Type': 'application/json' },
+      headers: jsonHeaders(version),
       body: JSON.stringify(data),
     });
     if (!response.ok) throw new Error('Failed to update card');
@@ -147,7 +170,7 @@ export const cardsApi = {
 
   // Delete card
   delete: async (cardId: string): Promise<void> => {
-    const response = await fetch(`${API_BASE_URL}/cards/${cardId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/cards/${cardId}`, {
       method: 'DELETE',
     });
     if (!response.ok) throw new Error('Failed to delete card');
@@ -176,7 +199,7 @@ export interface ChatResponse {
 export const chatApi = {
   // Send message to AI assistant
   sendMessage: async (boardId: string, message: string): Promise<ChatResponse> => {
-    const response = await fetch(`${API_BASE_URL}/chat/message`, {
+    const response = await apiFetch(`${API_BASE_URL}/chat/message`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ board_id: boardId, message }),
@@ -187,14 +210,14 @@ export const chatApi = {
 
   // Get chat history for a board
   getHistory: async (boardId: string): Promise<ChatMessage[]> => {
-    const response = await fetch(`${API_BASE_URL}/chat/history/${boardId}`);
+    const response = await apiFetch(`${API_BASE_URL}/chat/history/${boardId}`);
     if (!response.ok) throw new Error('Failed to fetch chat history');
     return response.json();
   },
 
   // Clear chat history for a board
   clearHistory: async (boardId: string): Promise<void> => {
-    const response = await fetch(`${API_BASE_URL}/chat/history/${boardId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/chat/history/${boardId}`, {
       method: 'DELETE',
     });
     if (!response.ok) throw new Error('Failed to clear chat history');